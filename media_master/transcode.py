@@ -2459,27 +2459,23 @@ def transcode_all_missions(
         )
 
         episode_list_re_exp: str = "(\\d+)~(\\d+)"
-        for key in mission_config.keys():
-            if key == "episode_list" and isinstance(mission_config[key], str):
-                re_result = re.search(episode_list_re_exp, mission_config[key])
-                if not re_result:
-                    raise ValueError("format of episode_list str is inaccurate.")
-                first_episode: int = int(re_result.group(1))
-                last_episode: int = int(re_result.group(2))
-                step: int = 1
-                if first_episode > last_episode:
-                    step = -1
-                mission_config[key] = [
-                    episode
-                    for episode in range(first_episode, last_episode + step, step)
-                ]
-                continue
-            if (
-                key in param_template_key_set
-                and mission_config[key]
-                and isinstance(mission_config[key], str)
-            ):
-                mission_config[key] = param_template_dict[key][mission_config[key]]
+        episode_list = mission_config.get("episode_list")
+        if isinstance(episode_list, str):
+            re_result = re.search(episode_list_re_exp, episode_list)
+            if not re_result:
+                raise ValueError("format of episode_list str is inaccurate.")
+            first_episode: int = int(re_result.group(1))
+            last_episode: int = int(re_result.group(2))
+            step: int = 1
+            if first_episode > last_episode:
+                step = -1
+            mission_config["episode_list"] = list(
+                range(first_episode, last_episode + step, step)
+            )
+
+        for key, value in mission_config.items():
+            if key in param_template_key_set and value and isinstance(value, str):
+                mission_config[key] = param_template_dict[key][value]
 
         all_output_filepath_set |= get_output_filepath_set(mission_config)
 
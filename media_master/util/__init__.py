@@ -5,6 +5,7 @@ from .constant import global_constant
 from .extraction import (
     copy_video,
     extract_all_attachments,
+    extract_all_from_mkv,
     extract_all_subtitles,
     extract_audio_track,
     extract_chapter,
@@ -0,0 +1,346 @@
+"""
+    _constant_data.py pre-built constant data of media_master
+
+    This module is the source of truth for the constants returned by
+    global_constant(), edit them here. A new constant also needs an entry in
+    CONSTANT_DICT at the end of this module.
+
+    Copyright (C) 2020  Ace C Lee
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+class _FrozenDict(dict):
+    def _raise_immutable(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} object does not support mutation")
+
+    __setitem__ = _raise_immutable
+    __delitem__ = _raise_immutable
+    __ior__ = _raise_immutable
+    clear = _raise_immutable
+    pop = _raise_immutable
+    popitem = _raise_immutable
+    setdefault = _raise_immutable
+    update = _raise_immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo: dict):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+VALID_FILE_SUFFIX: str = "_valid"
+DELETE_CACHE_FILE_BOOL_CONFIG_KEY: str = "delete_cache_file_bool"
+PYTHON_TEXT_CODEC_DICT: dict = _FrozenDict({"utf_8_bom": "utf-8-sig"})
+VAPOURSYNTH_LWLIBAVSOURCE_CACHE_FILE_EXTENSION: str = ".lwi"
+AVAILABLE_CONFIG_FORMAT_SET: frozenset = frozenset({"hocon", "json", "yaml"})
+AVAILABLE_CONFIG_FORMAT_EXTENSION_DICT: dict = _FrozenDict(
+    {
+        "json": frozenset({".json"}),
+        "yaml": frozenset({".yaml", ".yml"}),
+        "hocon": frozenset({".conf", ".hocon"}),
+    }
+)
+CONFIG_EXTENSION_FORMAT_DICT: dict = _FrozenDict(
+    {
+        ".json": "json",
+        ".yaml": "yaml",
+        ".yml": "yaml",
+        ".conf": "hocon",
+        ".hocon": "hocon",
+    }
+)
+AVAILABLE_PACKAGE_FORMAT_SET: frozenset = frozenset({"mkv", "mp4"})
+AVAILABLE_VIDEO_PROCESS_OPTION_SET: frozenset = frozenset({"copy", "transcode"})
+AVAILABLE_FRAME_SERVER_SET: frozenset = frozenset({"", "vspipe"})
+AVAILABLE_VIDEO_TRANSCODING_METHOD_SET: frozenset = frozenset({"nvenc", "x264", "x265"})
+AVAILABLE_OUTPUT_FRAME_RATE_MODE_SET: frozenset = frozenset(
+    {"", "auto", "cfr", "unchange", "vfr"}
+)
+AVAILABLE_OUTPUT_DYNAMIC_RANGE_MODE_SET: frozenset = frozenset(
+    {"", "hdr", "sdr", "unchange"}
+)
+AVAILABLE_AUDIO_PRIOR_OPTION_SET: frozenset = frozenset({"external", "internal"})
+AVAILABLE_EXTERNAL_AUDIO_PROCESS_OPTION_SET: frozenset = frozenset(
+    {"copy", "transcode"}
+)
+AVAILABLE_INTERNAL_AUDIO_TRACK_TO_PROCESS_SET: frozenset = frozenset({"all", "default"})
+AVAILABLE_INTERNAL_AUDIO_PROCESS_OPTION_SET: frozenset = frozenset(
+    {"copy", "skip", "transcode"}
+)
+AVAILABLE_SUBTITLE_PRIOR_OPTION_SET: frozenset = frozenset({"external", "internal"})
+VIDEO_TYPE: str = "video"
+AUDIO_TYPE: str = "audio"
+SUBTITLE_TYPE: str = "subtitle"
+TRACK_ID_KEY: str = "track_id"
+MEDIAINFO_WIDTH_KEY: str = "width"
+MEDIAINFO_HEIGHT_KEY: str = "height"
+MEDIAINFO_BIT_DEPTH_KEY: str = "bit_depth"
+MATROSKA_EXTENSIONS: tuple = (".mkv", ".mka", "mks")
+MATROSKA_VIDEO_EXTENSION: str = ".mkv"
+MATROSKA_AUDIO_EXTENSION: str = ".mka"
+MATROSKA_SUBTITLE_EXTENSION: str = ".mks"
+MEDIAINFO_VIDEO_TYPE: str = "Video"
+MEDIAINFO_AUDIO_TYPE: str = "Audio"
+MEDIAINFO_SUBTITLE_TYPE: str = "Text"
+MEDIAINFO_TRACK_ID_KEY: str = "streamorder"
+HEVC_TRACK_EXTENSION: str = ".265"
+AVC_TRACK_EXTENSION: str = ".264"
+MEDIAINFO_COLORMATRIX_KEY: str = "matrix_coefficients"
+MEDIAINFO_COLORPRIM_KEY: str = "color_primaries"
+MEDIAINFO_TRANSFER_KEY: str = "transfer_characteristics"
+MEDIAINFO_COLORMATRIX_BT709: str = "BT.709"
+MEDIAINFO_COLORPRIM_BT709: str = "BT.709"
+MEDIAINFO_TRANSFER_BT709: str = "BT.709"
+ENCODER_COLORMATRIX_BT709: str = "bt709"
+ENCODER_COLORPRIM_BT709: str = "bt709"
+ENCODER_TRANSFER_BT709: str = "bt709"
+VAPOURSYNTH_COLORMATRIX_BT709: str = "709"
+VAPOURSYNTH_COLORPRIM_BT709: str = "709"
+VAPOURSYNTH_TRANSFER_BT709: str = "709"
+FMTCONV_COLORMATRIX_BT709: str = "709"
+FMTCONV_COLORPRIM_BT709: str = "709"
+FMTCONV_TRANSFER_BT709: str = "709"
+MEDIAINFO_COLORMATRIX_SMPTE170: str = "BT.601"
+MEDIAINFO_COLORPRIM_SMPTE170: str = "BT.601 NTSC"
+MEDIAINFO_TRANSFER_SMPTE170: str = "BT.601"
+ENCODER_COLORMATRIX_SMPTE170: str = "smpte170m"
+ENCODER_COLORPRIM_SMPTE170: str = "smpte170m"
+ENCODER_TRANSFER_SMPTE170: str = "smpte170m"
+VAPOURSYNTH_COLORMATRIX_SMPTE170: str = "170m"
+VAPOURSYNTH_COLORPRIM_SMPTE170: str = "170m"
+VAPOURSYNTH_TRANSFER_SMPTE170: str = "601"
+FMTCONV_COLORMATRIX_SMPTE170: str = "601"
+FMTCONV_COLORPRIM_SMPTE170: str = "170m"
+FMTCONV_TRANSFER_SMPTE170: str = "601"
+MEDIAINFO_COLORMATRIX_BT2020NC: str = "BT.2020 non-constant"
+MEDIAINFO_COLORMATRIX_BT2020C: str = "BT.2020 constant"
+MEDIAINFO_COLORPRIM_BT2020: str = "BT.2020"
+MEDIAINFO_COLORPRIM_P3: str = "Display P3"
+MEDIAINFO_TRANSFER_BT2020_10: str = "BT.2020 (10-bit)"
+MEDIAINFO_TRANSFER_BT2020_12: str = "BT.2020 (12-bit)"
+MEDIAINFO_TRANSFER_SMPTE2084: str = "PQ"
+ENCODER_COLORMATRIX_BT2020NC: str = "bt2020nc"
+ENCODER_COLORMATRIX_BT2020C: str = "bt2020c"
+ENCODER_COLORPRIM_BT2020: str = "bt2020"
+ENCODER_COLORPRIM_P3: str = "p3"
+ENCODER_TRANSFER_BT2020_10: str = "bt2020-10"
+ENCODER_TRANSFER_BT2020_12: str = "bt2020-12"
+ENCODER_TRANSFER_SMPTE2084: str = "smpte2084"
+VAPOURSYNTH_COLORMATRIX_BT2020NC: str = "2020ncl"
+VAPOURSYNTH_COLORMATRIX_BT2020C: str = "2020cl"
+VAPOURSYNTH_COLORPRIM_BT2020: str = "2020"
+VAPOURSYNTH_TRANSFER_BT2020_10: str = "2020_10"
+VAPOURSYNTH_TRANSFER_BT2020_12: str = "2020_12"
+VAPOURSYNTH_TRANSFER_SMPTE2084: str = "st2084"
+FMTCONV_COLORMATRIX_BT2020NC: str = "2020"
+FMTCONV_COLORPRIM_BT2020: str = "2020"
+FMTCONV_TRANSFER_BT2020_10: str = "2020_10"
+FMTCONV_TRANSFER_BT2020_12: str = "2020_12"
+FMTCONV_TRANSFER_SMPTE2084: str = "2084"
+FMTCONV_COLORMATRIX_RGB: str = "rgb"
+FMTCONV_COLORPRIM_SRGB: str = "srgb"
+FMTCONV_TRANSFER_LINEAR: str = "linear"
+BT2020_AVAILABLE_BIT_DEPTH_TUPLE: tuple = (10, 12)
+ENCODER_MAX_CLL_FORMAT_STR: str = (
+    "{max_content_light_level:.0f},{max_frameaverage_light_level:.0f}"
+)
+ENCODER_MASTER_DISPLAY_PRIM_BT2020_FORMAT_STR: str = (
+    "G(8500,39850)B(6550,2300)R(35400,14600)WP(15635,16450)L({max_master_display_luminance:.0f},{min_master_display_luminance:.0f})"
+)
+ENCODER_MASTER_DISPLAY_PRIM_P3_FORMAT_STR: str = (
+    "G(13250,34500)B(7500,3000)R(34000,16000)WP(15635,16450)L({max_master_display_luminance:.0f},{min_master_display_luminance:.0f})"
+)
+MEDIAINFO_MASTERING_DISPLAY_LUMINANCE_RE_EXP: str = (
+    "min: (?P<min>[\\d.]+?) cd/m2, max: (?P<max>[\\d.]+?) cd/m2"
+)
+MEDIAINFO_LIGHT_LEVEL_RE_EXP: str = "(?P<num>[\\d.]+?) cd/m2"
+MEDIAINFO_ENCODER_COLORMATRIX_DICT: dict = _FrozenDict(
+    {
+        "BT.709": "bt709",
+        "BT.601": "smpte170m",
+        "BT.2020 non-constant": "bt2020nc",
+        "BT.2020 constant": "bt2020c",
+    }
+)
+MEDIAINFO_ENCODER_COLORPRIM_DICT: dict = _FrozenDict(
+    {
+        "BT.709": "bt709",
+        "BT.601 NTSC": "smpte170m",
+        "BT.2020": "bt2020",
+        "Display P3": "p3",
+    }
+)
+MEDIAINFO_ENCODER_TRANSFER_DICT: dict = _FrozenDict(
+    {
+        "BT.709": "bt709",
+        "BT.601": "smpte170m",
+        "BT.2020 (10-bit)": "bt2020-10",
+        "BT.2020 (12-bit)": "bt2020-12",
+        "PQ": "smpte2084",
+    }
+)
+ENCODER_FMTCONV_COLORMATRIX_DICT: dict = _FrozenDict(
+    {
+        "bt709": "709",
+        "smpte170m": "601",
+        "bt2020nc": "2020",
+    }
+)
+ENCODER_FMTCONV_COLORPRIM_DICT: dict = _FrozenDict(
+    {
+        "bt709": "709",
+        "smpte170m": "170m",
+        "bt2020": "2020",
+    }
+)
+ENCODER_FMTCONV_TRANSFER_DICT: dict = _FrozenDict(
+    {
+        "bt709": "709",
+        "smpte170m": "601",
+        "bt2020-10": "2020_10",
+        "bt2020-12": "2020_12",
+        "smpte2084": "2084",
+    }
+)
+ENCODER_COLORMATRIX_TRANSFER_DICT: dict = _FrozenDict(
+    {
+        "bt709": "bt709",
+        "smpte170m": "smpte170m",
+        "bt2020nc": "smpte2084",
+        "bt2020c": "smpte2084",
+    }
+)
+ENCODER_COLORMATRIX_COLORPRIM_DICT: dict = _FrozenDict(
+    {
+        "bt709": "bt709",
+        "smpte170m": "smpte170m",
+        "bt2020nc": "bt2020",
+        "bt2020c": "bt2020",
+    }
+)
+
+CONSTANT_DICT: dict = _FrozenDict(
+    {
+        "valid_file_suffix": VALID_FILE_SUFFIX,
+        "delete_cache_file_bool_config_key": DELETE_CACHE_FILE_BOOL_CONFIG_KEY,
+        "python_text_codec_dict": PYTHON_TEXT_CODEC_DICT,
+        "vapoursynth_lwlibavsource_cache_file_extension": VAPOURSYNTH_LWLIBAVSOURCE_CACHE_FILE_EXTENSION,
+        "available_config_format_set": AVAILABLE_CONFIG_FORMAT_SET,
+        "available_config_format_extension_dict": AVAILABLE_CONFIG_FORMAT_EXTENSION_DICT,
+        "config_extension_format_dict": CONFIG_EXTENSION_FORMAT_DICT,
+        "available_package_format_set": AVAILABLE_PACKAGE_FORMAT_SET,
+        "available_video_process_option_set": AVAILABLE_VIDEO_PROCESS_OPTION_SET,
+        "available_frame_server_set": AVAILABLE_FRAME_SERVER_SET,
+        "available_video_transcoding_method_set": AVAILABLE_VIDEO_TRANSCODING_METHOD_SET,
+        "available_output_frame_rate_mode_set": AVAILABLE_OUTPUT_FRAME_RATE_MODE_SET,
+        "available_output_dynamic_range_mode_set": AVAILABLE_OUTPUT_DYNAMIC_RANGE_MODE_SET,
+        "available_audio_prior_option_set": AVAILABLE_AUDIO_PRIOR_OPTION_SET,
+        "available_external_audio_process_option_set": AVAILABLE_EXTERNAL_AUDIO_PROCESS_OPTION_SET,
+        "available_internal_audio_track_to_process_set": AVAILABLE_INTERNAL_AUDIO_TRACK_TO_PROCESS_SET,
+        "available_internal_audio_process_option_set": AVAILABLE_INTERNAL_AUDIO_PROCESS_OPTION_SET,
+        "available_subtitle_prior_option_set": AVAILABLE_SUBTITLE_PRIOR_OPTION_SET,
+        "video_type": VIDEO_TYPE,
+        "audio_type": AUDIO_TYPE,
+        "subtitle_type": SUBTITLE_TYPE,
+        "track_id_key": TRACK_ID_KEY,
+        "mediainfo_width_key": MEDIAINFO_WIDTH_KEY,
+        "mediainfo_height_key": MEDIAINFO_HEIGHT_KEY,
+        "mediainfo_bit_depth_key": MEDIAINFO_BIT_DEPTH_KEY,
+        "matroska_extensions": MATROSKA_EXTENSIONS,
+        "matroska_video_extension": MATROSKA_VIDEO_EXTENSION,
+        "matroska_audio_extension": MATROSKA_AUDIO_EXTENSION,
+        "matroska_subtitle_extension": MATROSKA_SUBTITLE_EXTENSION,
+        "mediainfo_video_type": MEDIAINFO_VIDEO_TYPE,
+        "mediainfo_audio_type": MEDIAINFO_AUDIO_TYPE,
+        "mediainfo_subtitle_type": MEDIAINFO_SUBTITLE_TYPE,
+        "mediainfo_track_id_key": MEDIAINFO_TRACK_ID_KEY,
+        "hevc_track_extension": HEVC_TRACK_EXTENSION,
+        "avc_track_extension": AVC_TRACK_EXTENSION,
+        "mediainfo_colormatrix_key": MEDIAINFO_COLORMATRIX_KEY,
+        "mediainfo_colorprim_key": MEDIAINFO_COLORPRIM_KEY,
+        "mediainfo_transfer_key": MEDIAINFO_TRANSFER_KEY,
+        "mediainfo_colormatrix_bt709": MEDIAINFO_COLORMATRIX_BT709,
+        "mediainfo_colorprim_bt709": MEDIAINFO_COLORPRIM_BT709,
+        "mediainfo_transfer_bt709": MEDIAINFO_TRANSFER_BT709,
+        "encoder_colormatrix_bt709": ENCODER_COLORMATRIX_BT709,
+        "encoder_colorprim_bt709": ENCODER_COLORPRIM_BT709,
+        "encoder_transfer_bt709": ENCODER_TRANSFER_BT709,
+        "vapoursynth_colormatrix_bt709": VAPOURSYNTH_COLORMATRIX_BT709,
+        "vapoursynth_colorprim_bt709": VAPOURSYNTH_COLORPRIM_BT709,
+        "vapoursynth_transfer_bt709": VAPOURSYNTH_TRANSFER_BT709,
+        "fmtconv_colormatrix_bt709": FMTCONV_COLORMATRIX_BT709,
+        "fmtconv_colorprim_bt709": FMTCONV_COLORPRIM_BT709,
+        "fmtconv_transfer_bt709": FMTCONV_TRANSFER_BT709,
+        "mediainfo_colormatrix_smpte170": MEDIAINFO_COLORMATRIX_SMPTE170,
+        "mediainfo_colorprim_smpte170": MEDIAINFO_COLORPRIM_SMPTE170,
+        "mediainfo_transfer_smpte170": MEDIAINFO_TRANSFER_SMPTE170,
+        "encoder_colormatrix_smpte170": ENCODER_COLORMATRIX_SMPTE170,
+        "encoder_colorprim_smpte170": ENCODER_COLORPRIM_SMPTE170,
+        "encoder_transfer_smpte170": ENCODER_TRANSFER_SMPTE170,
+        "vapoursynth_colormatrix_smpte170": VAPOURSYNTH_COLORMATRIX_SMPTE170,
+        "vapoursynth_colorprim_smpte170": VAPOURSYNTH_COLORPRIM_SMPTE170,
+        "vapoursynth_transfer_smpte170": VAPOURSYNTH_TRANSFER_SMPTE170,
+        "fmtconv_colormatrix_smpte170": FMTCONV_COLORMATRIX_SMPTE170,
+        "fmtconv_colorprim_smpte170": FMTCONV_COLORPRIM_SMPTE170,
+        "fmtconv_transfer_smpte170": FMTCONV_TRANSFER_SMPTE170,
+        "mediainfo_colormatrix_bt2020nc": MEDIAINFO_COLORMATRIX_BT2020NC,
+        "mediainfo_colormatrix_bt2020c": MEDIAINFO_COLORMATRIX_BT2020C,
+        "mediainfo_colorprim_bt2020": MEDIAINFO_COLORPRIM_BT2020,
+        "mediainfo_colorprim_p3": MEDIAINFO_COLORPRIM_P3,
+        "mediainfo_transfer_bt2020_10": MEDIAINFO_TRANSFER_BT2020_10,
+        "mediainfo_transfer_bt2020_12": MEDIAINFO_TRANSFER_BT2020_12,
+        "mediainfo_transfer_smpte2084": MEDIAINFO_TRANSFER_SMPTE2084,
+        "encoder_colormatrix_bt2020nc": ENCODER_COLORMATRIX_BT2020NC,
+        "encoder_colormatrix_bt2020c": ENCODER_COLORMATRIX_BT2020C,
+        "encoder_colorprim_bt2020": ENCODER_COLORPRIM_BT2020,
+        "encoder_colorprim_p3": ENCODER_COLORPRIM_P3,
+        "encoder_transfer_bt2020_10": ENCODER_TRANSFER_BT2020_10,
+        "encoder_transfer_bt2020_12": ENCODER_TRANSFER_BT2020_12,
+        "encoder_transfer_smpte2084": ENCODER_TRANSFER_SMPTE2084,
+        "vapoursynth_colormatrix_bt2020nc": VAPOURSYNTH_COLORMATRIX_BT2020NC,
+        "vapoursynth_colormatrix_bt2020c": VAPOURSYNTH_COLORMATRIX_BT2020C,
+        "vapoursynth_colorprim_bt2020": VAPOURSYNTH_COLORPRIM_BT2020,
+        "vapoursynth_transfer_bt2020_10": VAPOURSYNTH_TRANSFER_BT2020_10,
+        "vapoursynth_transfer_bt2020_12": VAPOURSYNTH_TRANSFER_BT2020_12,
+        "vapoursynth_transfer_smpte2084": VAPOURSYNTH_TRANSFER_SMPTE2084,
+        "fmtconv_colormatrix_bt2020nc": FMTCONV_COLORMATRIX_BT2020NC,
+        "fmtconv_colorprim_bt2020": FMTCONV_COLORPRIM_BT2020,
+        "fmtconv_transfer_bt2020_10": FMTCONV_TRANSFER_BT2020_10,
+        "fmtconv_transfer_bt2020_12": FMTCONV_TRANSFER_BT2020_12,
+        "fmtconv_transfer_smpte2084": FMTCONV_TRANSFER_SMPTE2084,
+        "fmtconv_colormatrix_rgb": FMTCONV_COLORMATRIX_RGB,
+        "fmtconv_colorprim_srgb": FMTCONV_COLORPRIM_SRGB,
+        "fmtconv_transfer_linear": FMTCONV_TRANSFER_LINEAR,
+        "bt2020_available_bit_depth_tuple": BT2020_AVAILABLE_BIT_DEPTH_TUPLE,
+        "encoder_max_cll_format_str": ENCODER_MAX_CLL_FORMAT_STR,
+        "encoder_master_display_prim_bt2020_format_str": ENCODER_MASTER_DISPLAY_PRIM_BT2020_FORMAT_STR,
+        "encoder_master_display_prim_p3_format_str": ENCODER_MASTER_DISPLAY_PRIM_P3_FORMAT_STR,
+        "mediainfo_mastering_display_luminance_re_exp": MEDIAINFO_MASTERING_DISPLAY_LUMINANCE_RE_EXP,
+        "mediainfo_light_level_re_exp": MEDIAINFO_LIGHT_LEVEL_RE_EXP,
+        "mediainfo_encoder_colormatrix_dict": MEDIAINFO_ENCODER_COLORMATRIX_DICT,
+        "mediainfo_encoder_colorprim_dict": MEDIAINFO_ENCODER_COLORPRIM_DICT,
+        "mediainfo_encoder_transfer_dict": MEDIAINFO_ENCODER_TRANSFER_DICT,
+        "encoder_fmtconv_colormatrix_dict": ENCODER_FMTCONV_COLORMATRIX_DICT,
+        "encoder_fmtconv_colorprim_dict": ENCODER_FMTCONV_COLORPRIM_DICT,
+        "encoder_fmtconv_transfer_dict": ENCODER_FMTCONV_TRANSFER_DICT,
+        "encoder_colormatrix_transfer_dict": ENCODER_COLORMATRIX_TRANSFER_DICT,
+        "encoder_colormatrix_colorprim_dict": ENCODER_COLORMATRIX_COLORPRIM_DICT,
+    }
+)
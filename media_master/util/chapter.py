@@ -16,16 +16,22 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import functools
 import logging
 import os
+import re
 import subprocess
 import sys
+import xml.etree.ElementTree as ElementTree
+
+from .charset import detect_charset
 
 g_logger = logging.getLogger(__name__)
 g_logger.propagate = True
 g_logger.setLevel(logging.DEBUG)
 
 
+@functools.lru_cache(maxsize=None)
 def get_chapter_format_info_dict():
     return dict(
         ogm=dict(ext=".txt", cmd_format="ogm"),
@@ -36,14 +42,158 @@ def get_chapter_format_info_dict():
     )
 
 
+def _timestamp_2_ms(timestamp: str) -> int:
+    time_str, _, fraction_str = timestamp.strip().partition(".")
+    hour, minute, second = (int(part) for part in time_str.split(":"))
+    ms: int = int(fraction_str[:3].ljust(3, "0")) if fraction_str else 0
+    return ((hour * 60 + minute) * 60 + second) * 1000 + ms
+
+
+def _ms_2_timestamp(ms: int) -> str:
+    second, ms = divmod(int(ms), 1000)
+    minute, second = divmod(second, 60)
+    hour, minute = divmod(minute, 60)
+    return f"{hour:02d}:{minute:02d}:{second:02d}.{ms:03d}"
+
+
+def _read_chapter_text_lines(filepath: str) -> list:
+    with open(filepath, "rb") as file:
+        raw_bytes: bytes = file.read()
+    text_str: str = raw_bytes.decode(detect_charset(raw_bytes)).lstrip("\ufeff")
+    return [line for line in text_str.splitlines() if line.strip()]
+
+
+def _parse_matroska_chapter(filepath: str) -> list:
+    chapter_list: list = []
+    for _, element in ElementTree.iterparse(filepath):
+        if element.tag != "ChapterAtom":
+            continue
+        start_time: str = element.findtext("ChapterTimeStart", default="")
+        chapter_name: str = element.findtext(
+            "ChapterDisplay/ChapterString", default=""
+        )
+        if start_time:
+            chapter_list.append((_timestamp_2_ms(start_time), chapter_name))
+        element.clear()
+    return chapter_list
+
+
+def _parse_text_chapter(filepath: str) -> list:
+    line_list: list = _read_chapter_text_lines(filepath)
+    if not line_list:
+        return []
+
+    simple_re_exp: str = "([0-9:.]+?), *(.+)"
+    tab_re_exp: str = "([0-9:.].+?)\t(.+)"
+    pot_re_exp: str = "\\d+=(\\d+)\\*([^*]+)"
+    chapter_list: list = []
+    first_line: str = line_list[0]
+    if re.match(simple_re_exp, first_line) or re.match(tab_re_exp, first_line):
+        line_re_exp: str = (
+            simple_re_exp if re.match(simple_re_exp, first_line) else tab_re_exp
+        )
+        for line in line_list:
+            re_result = re.match(line_re_exp, line)
+            if re_result:
+                chapter_list.append(
+                    (_timestamp_2_ms(re_result.group(1)), re_result.group(2))
+                )
+    elif re.match("CHAPTER\\d", first_line):
+        if len(line_list) % 2:
+            raise ValueError(
+                f"ogm chapter of {filepath} has no CHAPTERxxNAME line "
+                f"for {line_list[-1].strip()}"
+            )
+        for time_line, name_line in zip(line_list[0::2], line_list[1::2]):
+            time_re_result = re.match("CHAPTER\\d+=(.+)", time_line.strip())
+            name_re_result = re.match("CHAPTER\\d+NAME=(.*)", name_line.strip())
+            if not time_re_result or not name_re_result:
+                raise ValueError(
+                    f"malformed ogm chapter lines in {filepath}: "
+                    f"{time_line.strip()!r}, {name_line.strip()!r}"
+                )
+            chapter_list.append(
+                (_timestamp_2_ms(time_re_result.group(1)), name_re_result.group(1))
+            )
+    elif first_line.startswith("[Bookmark]"):
+        for line in line_list[1:]:
+            re_result = re.match(pot_re_exp, line.strip())
+            if re_result:
+                chapter_list.append((int(re_result.group(1)), re_result.group(2)))
+    else:
+        raise ValueError(f"unknown chapter format of {filepath}")
+    return chapter_list
+
+
+def _write_matroska_chapter(chapter_list: list, dst_filepath: str):
+    chapters_element = ElementTree.Element("Chapters")
+    edition_entry_element = ElementTree.SubElement(chapters_element, "EditionEntry")
+    for start_ms, chapter_name in chapter_list:
+        chapter_atom_element = ElementTree.SubElement(
+            edition_entry_element, "ChapterAtom"
+        )
+        ElementTree.SubElement(
+            chapter_atom_element, "ChapterTimeStart"
+        ).text = _ms_2_timestamp(start_ms)
+        chapter_display_element = ElementTree.SubElement(
+            chapter_atom_element, "ChapterDisplay"
+        )
+        ElementTree.SubElement(
+            chapter_display_element, "ChapterString"
+        ).text = chapter_name
+    ElementTree.ElementTree(chapters_element).write(
+        dst_filepath, encoding="utf-8", xml_declaration=True
+    )
+
+
+def _get_chapter_text(chapter_list: list, dst_chapter_format: str) -> str:
+    if dst_chapter_format == "ogm":
+        line_list: list = []
+        for index, (start_ms, chapter_name) in enumerate(chapter_list, start=1):
+            line_list.append(f"CHAPTER{index:02d}={_ms_2_timestamp(start_ms)}")
+            line_list.append(f"CHAPTER{index:02d}NAME={chapter_name}")
+    elif dst_chapter_format == "pot":
+        line_list: list = ["[Bookmark]"] + [
+            f"{index}={start_ms}*{chapter_name}*"
+            for index, (start_ms, chapter_name) in enumerate(chapter_list)
+        ]
+    elif dst_chapter_format == "simple":
+        line_list: list = [
+            f"{_ms_2_timestamp(start_ms)},{chapter_name}"
+            for start_ms, chapter_name in chapter_list
+        ]
+    elif dst_chapter_format == "tab":
+        line_list: list = [
+            f"{_ms_2_timestamp(start_ms)}\t{chapter_name}"
+            for start_ms, chapter_name in chapter_list
+        ]
+    else:
+        raise ValueError(f"unknown dst_chapter_format: {dst_chapter_format}")
+    return "".join(f"{line}\n" for line in line_list)
+
+
+def _convert_chapter(
+    src_chapter_filepath: str, dst_filepath: str, dst_chapter_format: str
+):
+    if src_chapter_filepath.lower().endswith(".xml"):
+        chapter_list: list = _parse_matroska_chapter(src_chapter_filepath)
+    else:
+        chapter_list: list = _parse_text_chapter(src_chapter_filepath)
+
+    if dst_chapter_format == "matroska":
+        _write_matroska_chapter(chapter_list, dst_filepath)
+    else:
+        with open(dst_filepath, "w", encoding="utf-8-sig") as file:
+            file.write(_get_chapter_text(chapter_list, dst_chapter_format))
+
+
 def convert_chapter_format(
     src_chapter_filepath: str,
     output_dir: str,
     output_filename: str,
     dst_chapter_format: str,
 ) -> str:
-    if not os.path.isdir(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     all_format_info_dict: dict = dict(
         ogm=dict(ext=".txt", cmd_format="ogm"),
         pot=dict(ext=".pbf", cmd_format="pot"),
@@ -67,6 +217,32 @@ def convert_chapter_format(
     if os.path.isfile(dst_filepath):
         os.remove(dst_filepath)
 
+    chapter_extension_set: set = set(
+        format_info["ext"] for format_info in all_format_info_dict.values()
+    )
+    if (
+        not os.environ.get("MM_USE_LEGACY_CHAPTER_CONVERTER")
+        and src_extension.lower() in chapter_extension_set
+    ):
+        start_info_str: str = (
+            f"convert_chapter_format: "
+            f"start convert {src_chapter_filepath} "
+            f"to {dst_filepath}"
+        )
+        g_logger.log(logging.INFO, start_info_str)
+        print(start_info_str, file=sys.stderr)
+
+        _convert_chapter(src_chapter_filepath, dst_filepath, dst_chapter_format)
+
+        end_info_str: str = (
+            f"convert_chapter_format: "
+            f"convert {src_chapter_filepath} "
+            f"to {dst_filepath} successfully."
+        )
+        print(end_info_str, file=sys.stderr)
+        g_logger.log(logging.INFO, end_info_str)
+        return dst_filepath
+
     python_exe = "python.exe"
 
     cmd_param_list: list = [
@@ -16,37 +16,75 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import chardet
-from .constant import global_constant
+try:
+    import cchardet as chardet
+except ImportError:
+    import chardet
+from .constant import PYTHON_TEXT_CODEC_DICT
 import logging
+import mmap
 
 g_logger = logging.getLogger(__name__)
 g_logger.propagate = True
 g_logger.setLevel(logging.DEBUG)
 
 
-def is_utf8bom(filepath: str) -> bool:
-    charset: str = ""
-    constant = global_constant()
-    python_text_codec_dict: dict = constant.python_text_codec_dict
-    with open(filepath, "rb") as file:
-        result_dict: dict = chardet.detect(file.read())
-        charset = result_dict["encoding"].lower()
+def _sniff_bom_charset(prefix_bytes: bytes) -> str:
+    bom_charset_tuple: tuple = (
+        (b"\xef\xbb\xbf", "utf-8-sig"),
+        (b"\xff\xfe\x00\x00", "utf-32-le"),
+        (b"\x00\x00\xfe\xff", "utf-32-be"),
+        (b"\xff\xfe", "utf-16-le"),
+        (b"\xfe\xff", "utf-16-be"),
+    )
+    for bom_bytes, charset in bom_charset_tuple:
+        if prefix_bytes.startswith(bom_bytes):
+            return charset
+    return ""
+
+
+def _detect_charset(chunk_iterable) -> str:
+    detector = chardet.UniversalDetector()
+    for chunk in chunk_iterable:
+        detector.feed(chunk)
+        if detector.done:
+            break
+    detector.close()
+    return (detector.result["encoding"] or "utf-8").lower()
+
+
+def _iter_bytes_chunk(raw_bytes, chunk_size: int = 65536):
+    return (
+        raw_bytes[index : index + chunk_size]
+        for index in range(0, len(raw_bytes), chunk_size)
+    )
 
-    return_bool: bool = False
-    if charset == python_text_codec_dict["utf_8_bom"]:
-        return_bool = True
 
-    return return_bool
+def detect_charset(raw_bytes: bytes) -> str:
+    charset: str = _sniff_bom_charset(raw_bytes[:4])
+    if charset:
+        return charset
+    return _detect_charset(_iter_bytes_chunk(raw_bytes))
+
+
+def is_utf8bom(filepath: str) -> bool:
+    with open(filepath, "rb") as file:
+        charset: str = _sniff_bom_charset(file.read(4))
+    return charset == PYTHON_TEXT_CODEC_DICT["utf_8_bom"]
 
 
 def convert_codec_2_uft8bom(filepath: str):
     charset: str = ""
-    constant = global_constant()
-    python_text_codec_dict: dict = constant.python_text_codec_dict
+    python_text_codec_dict: dict = PYTHON_TEXT_CODEC_DICT
     with open(filepath, "rb") as file:
-        result_dict: dict = chardet.detect(file.read())
-        charset = result_dict["encoding"].lower()
+        prefix_bytes: bytes = file.read(4)
+        charset = _sniff_bom_charset(prefix_bytes)
+        if not prefix_bytes or charset == python_text_codec_dict["utf_8_bom"]:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as file_mmap:
+            if not charset:
+                charset = _detect_charset(_iter_bytes_chunk(file_mmap))
+            raw_bytes: bytes = file_mmap[:]
 
     if charset != python_text_codec_dict["utf_8_bom"]:
         start_info_str: str = (
@@ -55,9 +93,12 @@ def convert_codec_2_uft8bom(filepath: str):
         )
         g_logger.log(logging.INFO, start_info_str)
 
-        text_str: str = ""
-        with open(filepath, "r", encoding=charset) as file:
-            text_str = file.read()
+        text_str: str = (
+            raw_bytes.decode(charset)
+            .lstrip("\ufeff")
+            .replace("\r\n", "\n")
+            .replace("\r", "\n")
+        )
 
         with open(
             filepath, "w", encoding=python_text_codec_dict["utf_8_bom"]
@@ -68,5 +109,3 @@ def convert_codec_2_uft8bom(filepath: str):
             f"convert codec of {filepath} to utf-8-bom successfully"
         )
         g_logger.log(logging.INFO, end_info_str)
-
-
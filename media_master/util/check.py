@@ -30,16 +30,26 @@ def check_file_environ_path(filename_set: set) -> bool:
             f"type of all the elements in filename_set must be str"
         )
 
-    path_str: str = os.environ.get("PATH")
-    path_dir_set: set = set(path_str.split(";"))
-    all_filename_set: set = set()
-    for path_dir in path_dir_set:
-        all_filename_set |= (
-            set(os.listdir(path_dir)) if os.path.isdir(path_dir) else set()
-        )
-    all_filename_set = set(filename.lower() for filename in all_filename_set)
+    path_str: str = os.environ.get("PATH", "")
+    path_dir_list: list = [
+        path_dir
+        for path_dir in dict.fromkeys(path_str.split(os.pathsep))
+        if path_dir and os.path.isdir(path_dir)
+    ]
+    path_ext_list: list = [""] + [
+        path_ext
+        for path_ext in os.environ.get("PATHEXT", "").split(os.pathsep)
+        if path_ext
+    ]
     return all(
-        filename.lower() in all_filename_set for filename in filename_set
+        any(
+            os.path.isfile(os.path.join(path_dir, filename + path_ext))
+            for path_dir in path_dir_list
+            for path_ext in (
+                path_ext_list if not os.path.splitext(filename)[1] else [""]
+            )
+        )
+        for filename in filename_set
     )
 
 
@@ -16,12 +16,88 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import copy
+import functools
 import json
+import logging
 import os
-from .constant import global_constant
+from .constant import CONFIG_EXTENSION_FORMAT_DICT
 from ..error import RangeError
-import yaml
-import pyhocon
+
+g_logger = logging.getLogger(__name__)
+g_logger.propagate = True
+g_logger.setLevel(logging.DEBUG)
+
+try:
+    import orjson
+
+    def _json_load(file):
+        return orjson.loads(file.read())
+
+    def _json_dumps(data, indent_bool: bool = False) -> bytes:
+        option: int = orjson.OPT_NON_STR_KEYS
+        if indent_bool:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+except ImportError:
+
+    def _json_load(file):
+        return json.load(file)
+
+    def _json_dumps(data, indent_bool: bool = False) -> bytes:
+        return json.dumps(
+            data, indent=2 if indent_bool else None, ensure_ascii=False
+        ).encode("utf-8")
+
+
+g_config_cache_dict: dict = {}
+g_config_io_buffer_size: int = 1 << 18
+
+
+def _open_config_file(config_filepath: str):
+    return open(
+        config_filepath, "r", encoding="utf-8", buffering=g_config_io_buffer_size
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_yaml_safe_loader():
+    try:
+        from yaml import CSafeLoader as YamlSafeLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlSafeLoader
+
+        g_logger.log(
+            logging.WARNING,
+            "config: libyaml is not available, fall back to the pure python "
+            "yaml loader, install libyaml to speed up loading yaml config.",
+        )
+    return YamlSafeLoader
+
+
+def _load_yaml_config(config_filepath: str) -> dict:
+    import yaml
+
+    with _open_config_file(config_filepath) as file:
+        return yaml.load(file, Loader=_get_yaml_safe_loader())
+
+
+def _load_hocon_config(config_filepath: str) -> dict:
+    import pyhocon
+
+    with _open_config_file(config_filepath) as file:
+        return pyhocon.ConfigFactory.parse_string(file.read()).as_plain_ordered_dict()
+
+
+def _load_json_config(config_filepath: str) -> dict:
+    with _open_config_file(config_filepath) as file:
+        return _json_load(file)
+
+
+g_config_loader_dict: dict = dict(
+    json=_load_json_config, yaml=_load_yaml_config, hocon=_load_hocon_config
+)
 
 
 def load_config(config_filepath):
@@ -35,49 +111,32 @@ def load_config(config_filepath):
             f"input config file cannot be found with {config_filepath}"
         )
 
-    constant = global_constant()
-
-    available_config_format_set: set = constant.available_config_format_set
-    available_config_format_extension_dict: dict = constant.available_config_format_extension_dict
-    available_config_format_extension_set: set = set()
-    for extension_set in available_config_format_extension_dict.values():
-        available_config_format_extension_set |= extension_set
+    config_extension: str = os.path.splitext(config_filepath)[1]
 
-    config_full_filename: str = os.path.basename(config_filepath)
-    config_filename, config_extension = os.path.splitext(config_full_filename)
-
-    if config_extension not in available_config_format_extension_set:
+    config_format: str = CONFIG_EXTENSION_FORMAT_DICT.get(config_extension)
+    if config_format is None:
         raise RangeError(
             message=(f"Unknown config_extension: {config_extension}"),
-            valid_range=str(available_config_format_extension_set),
+            valid_range=str(set(CONFIG_EXTENSION_FORMAT_DICT.keys())),
         )
 
-    config_format: str = ""
-    for current_config_format in available_config_format_set:
-        if (
-            config_extension
-            in available_config_format_extension_dict[current_config_format]
-        ):
-            config_format = current_config_format
-            break
-
-    if not config_format:
-        raise ValueError(f"it is not possible to run this code.")
-
-    config_data_dict: dict = {}
-    with open(config_filepath, "r", encoding="utf-8") as file:
-        if config_format == "json":
-            config_data_dict = json.loads(file.read())
-        elif config_format == "yaml":
-            config_data_dict = yaml.load(file, Loader=yaml.SafeLoader)
-        elif config_format == "hocon":
-            config_data_dict = pyhocon.ConfigFactory.parse_string(
-                file.read()
-            ).as_plain_ordered_dict()
-        else:
-            raise ValueError(f"it is not possible to run this code.")
-
-    return config_data_dict
+    if os.path.getsize(config_filepath) == 0:
+        raise ValueError(f"input config file {config_filepath} is empty")
+
+    config_abs_filepath: str = os.path.abspath(config_filepath)
+    config_stat = os.stat(config_abs_filepath)
+    config_stat_tuple: tuple = (config_stat.st_mtime_ns, config_stat.st_size)
+    cache_stat_tuple, cache_config_data_dict = g_config_cache_dict.get(
+        config_abs_filepath, (None, None)
+    )
+    if cache_stat_tuple == config_stat_tuple:
+        return copy.deepcopy(cache_config_data_dict)
+
+    config_data_dict: dict = g_config_loader_dict[config_format](config_filepath)
+
+    g_config_cache_dict[config_abs_filepath] = (config_stat_tuple, config_data_dict)
+
+    return copy.deepcopy(config_data_dict)
 
 
 def save_config(config_json_filepath: str, config_dict: dict):
@@ -94,5 +153,10 @@ def save_config(config_json_filepath: str, config_dict: dict):
     config_json_dir = os.path.abspath(os.path.dirname(config_json_filepath))
     if not os.path.isdir(config_json_dir):
         os.makedirs(config_json_dir)
-    with open(config_json_filepath, "w", encoding="utf-8") as file:
-        file.write(json.dumps(config_dict, indent=4, ensure_ascii=False))
+    config_json_bytes: bytes = _json_dumps(config_dict, indent_bool=True)
+    config_json_tmp_filepath: str = config_json_filepath + ".tmp"
+    with open(config_json_tmp_filepath, "wb") as file:
+        file.write(config_json_bytes)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(config_json_tmp_filepath, config_json_filepath)
@@ -16,13 +16,24 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import atexit
+import concurrent.futures
+import dataclasses
+import datetime
+import functools
+import json
 import logging
+import operator
 import os
 import re
 import shutil
 import subprocess
 import sys
-from xml.dom import minidom
+import threading
+import time
+import types
+from operator import itemgetter
+from xml.sax.saxutils import escape
 
 from pymediainfo import MediaInfo
 
@@ -34,7 +45,6 @@ from ..track import (
     VideoTrackFile,
 )
 from .chapter import convert_chapter_format, get_chapter_format_info_dict
-from .check import check_file_environ_path
 from .meta_data import (
     get_float_frame_rate,
     get_proper_color_specification,
@@ -55,23 +65,306 @@ g_logger = logging.getLogger(__name__)
 g_logger.propagate = True
 g_logger.setLevel(logging.DEBUG)
 
+g_streamorder_re = re.compile(r"(?:\d+-)?(\d+)$")
+g_chapter_time_re = re.compile(r"\d{2}_\d{2}_\d{5}")
+
+g_matroska_suffix_frozenset: frozenset = frozenset({".mkv", ".mka", ".mks"})
+g_companion_extension_dict: dict = {".idx": (".sub",)}
+# NUMBER_OF_BYTES counts the block payloads stored in the container, the raw
+# stream written back by the extractor can come out slightly smaller, so an
+# existing output counts as complete from 98% of the expected size upwards
+g_expected_bytes_min_ratio: float = 0.98
+g_video_container_track_suffix_dict: dict = {
+    ".mp4": ".mp4",
+    ".m4v": ".mp4",
+    ".flv": ".flv",
+}
+
+g_subtitle_format_suffix_dict: dict = {"pgs": "sup", "vobsub": "idx", "utf-8": "srt"}
+g_video_format_suffix_dict: dict = {
+    "hevc": "265",
+    "avc": "264",
+    "mpeg-4 visual": "263",
+    "mpeg video": "mpeg",
+}
+g_audio_format_suffix_dict: dict = {
+    "e-ac-3": "ec3",
+    "ac-3": "ac3",
+    "pcm": "wav",
+    "mlp fba": "thd",
+    "wma": "wma",
+}
+g_mpeg_audio_profile_suffix_dict: dict = {"layer 3": "mp3", "layer 2": "mp2"}
+g_mkv_track_type_frozenset: frozenset = frozenset(
+    {"video", "audio", "text", "timecode"}
+)
+g_mkvmerge_track_type_dict: dict = {"subtitles": "text"}
+g_audio_track_frozenset: frozenset = frozenset({"default", "all"})
+g_yes_no_bool_dict: dict = {
+    "Yes": True,
+    "yes": True,
+    "YES": True,
+    "No": False,
+    "no": False,
+    "NO": False,
+}
+
+g_hdr_field_getter = itemgetter(
+    "mastering_display_color_primaries",
+    "min_mastering_display_luminance",
+    "max_mastering_display_luminance",
+    "max_content_light_level",
+    "max_frameaverage_light_level",
+)
+g_default_hdr_field_tuple: tuple = ("", -1, -1, -1, -1)
+
+g_extraction_max_workers: int = min(os.cpu_count() or 1, 4)
+# extract_track_ffmpeg_async blocks once this many requests are queued or running
+g_extraction_max_in_flight: int = g_extraction_max_workers * 4
+g_extraction_in_flight_semaphore = threading.BoundedSemaphore(
+    g_extraction_max_in_flight
+)
+
+g_stdout_pipe_buffer_size: int = 1 << 20
+g_stdout_chunk_size: int = 1 << 16
+g_stdout_echo_interval_s: float = 0.5
+
+# stream copy only demuxes, so extra ffmpeg worker threads buy nothing here
+g_ffmpeg_stream_copy_param_tuple: tuple = ("-threads", "1", "-codec", "copy")
+g_ffmpeg_verbose_param_tuple: tuple = ("-hide_banner",)
+g_ffmpeg_quiet_param_tuple: tuple = ("-hide_banner", "-nostats", "-loglevel", "error")
+g_ffmpeg_track_type_frozenset: frozenset = frozenset({"video", "audio", "subtitle"})
+g_ffmpeg_map_symbol_dict: dict = {"video": "v", "audio": "a", "subtitle": "s"}
+g_ffmpeg_disable_stream_param_dict: dict = {
+    "video": ("-an", "-sn", "-dn"),
+    "audio": ("-vn", "-sn", "-dn"),
+    "subtitle": ("-vn", "-an", "-dn"),
+}
+g_ffmpeg_input_param_dict: dict = {
+    ".ts": ("-fflags", "+genpts"),
+    ".m2ts": ("-fflags", "+genpts"),
+    ".mts": ("-fflags", "+genpts"),
+}
+
+
+def _freeze_parse_result(value):
+    if isinstance(value, dict):
+        return types.MappingProxyType(
+            {key: _freeze_parse_result(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_freeze_parse_result(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_media_info(filepath: str, mtime_ns: int, size_byte: int) -> tuple:
+    return tuple(
+        types.MappingProxyType(
+            {sys.intern(key): value for key, value in track_dict.items()}
+        )
+        for track_dict in MediaInfo.parse(filepath).to_data()["tracks"]
+    )
+
+
+def _get_media_info_list(filepath: str) -> list:
+    file_stat = os.stat(filepath)
+    media_info_tuple: tuple = _parse_media_info(
+        os.path.abspath(filepath), file_stat.st_mtime_ns, file_stat.st_size
+    )
+    return list(media_info_tuple)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_mkv_identify(
+    filepath: str, mtime_ns: int, size_byte: int, mkvmerge_exe_filepath: str
+) -> tuple:
+    cmd_param_list: list = [
+        mkvmerge_exe_filepath,
+        "--identify",
+        "--identification-format",
+        "json",
+        filepath,
+    ]
+    if g_logger.isEnabledFor(logging.DEBUG):
+        g_logger.log(
+            logging.DEBUG,
+            f"identification mkvmerge: param: "
+            f"{subprocess.list2cmdline(cmd_param_list)}",
+        )
+    result = subprocess.run(
+        cmd_param_list,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="ignore",
+    )
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode=result.returncode,
+            cmd=subprocess.list2cmdline(cmd_param_list),
+            output=result.stdout,
+        )
+    identify_dict = _freeze_parse_result(json.loads(result.stdout))
+    track_id_dict = types.MappingProxyType(
+        {track_info["id"]: track_info for track_info in identify_dict.get("tracks", ())}
+    )
+    return identify_dict, track_id_dict
+
+
+def _get_mkv_identify_result(filepath: str, mkvmerge_exe_file_dir: str) -> tuple:
+    file_stat = os.stat(filepath)
+    return _parse_mkv_identify(
+        os.path.abspath(filepath),
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        _resolve_exe("mkvmerge.exe", mkvmerge_exe_file_dir),
+    )
+
+
+def _mkv_identify(filepath: str, mkvmerge_exe_file_dir: str = "") -> dict:
+    identify_dict, _ = _get_mkv_identify_result(filepath, mkvmerge_exe_file_dir)
+    return identify_dict
+
+
+def _mkv_track_id_dict(filepath: str, mkvmerge_exe_file_dir: str = "") -> dict:
+    _, track_id_dict = _get_mkv_identify_result(filepath, mkvmerge_exe_file_dir)
+    return track_id_dict
+
+
+def _echo_stdout(echo_chunk_list: list):
+    echo_bytes: bytes = b"".join(echo_chunk_list)
+    echo_chunk_list.clear()
+    stderr = sys.stderr
+    if stderr is None:
+        return
+    try:
+        stderr.flush()
+        stderr_buffer = getattr(stderr, "buffer", None)
+        if stderr_buffer is None:
+            stderr.write(echo_bytes.decode("utf-8", errors="replace"))
+            stderr.flush()
+        else:
+            stderr_buffer.write(echo_bytes)
+            stderr_buffer.flush()
+    except Exception as error:
+        g_logger.log(logging.DEBUG, f"extraction: echo stdout unsuccessfully: {error}")
+
+
+def _drain_stdout(stdout, stdout_bytearray: bytearray, quiet: bool = False):
+    echo_chunk_list: list = []
+    echo_byte_count: int = 0
+    last_echo_time: float = time.monotonic()
+    for stdout_chunk in iter(lambda: stdout.read1(g_stdout_chunk_size), b""):
+        stdout_bytearray += stdout_chunk
+        if quiet:
+            continue
+        echo_chunk_list.append(stdout_chunk)
+        echo_byte_count += len(stdout_chunk)
+        current_time: float = time.monotonic()
+        if (
+            echo_byte_count >= g_stdout_chunk_size
+            or current_time - last_echo_time >= g_stdout_echo_interval_s
+        ):
+            _echo_stdout(echo_chunk_list)
+            echo_byte_count = 0
+            last_echo_time = current_time
+    if echo_chunk_list:
+        _echo_stdout(echo_chunk_list)
+
+
+def _wait_process_draining_stdout(
+    process: subprocess.Popen, quiet: bool = False
+) -> bytearray:
+    stdout_bytearray: bytearray = bytearray()
+    drain_thread = threading.Thread(
+        target=_drain_stdout,
+        args=(process.stdout, stdout_bytearray, quiet),
+        daemon=True,
+    )
+    drain_thread.start()
+    process.wait()
+    drain_thread.join()
+    process.stdout.close()
+
+    return stdout_bytearray
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_exe(exe_name: str, hint_dir: str) -> str:
+    if hint_dir:
+        if not os.path.isdir(hint_dir):
+            raise DirNotFoundError(
+                f"{os.path.splitext(exe_name)[0]} dir cannot be found with {hint_dir}"
+            )
+        exe_filepath: str = os.path.join(hint_dir, exe_name)
+        if not os.path.isfile(exe_filepath):
+            raise FileNotFoundError(f"{exe_name} cannot be found in {hint_dir}")
+        return exe_filepath
+
+    exe_filepath = shutil.which(exe_name)
+    if exe_filepath is None:
+        raise FileNotFoundError(f"{exe_name} cannot be found in environment path")
+    return exe_filepath
+
+
+def _check_str_param(**param_dict):
+    for param_name, param_value in param_dict.items():
+        if not isinstance(param_value, str):
+            raise TypeError(
+                f"type of {param_name} must be str instead of {type(param_value)}"
+            )
+
 
 def split_mediainfo_str2list(string: str) -> list:
     return string.split(sep=" / ")
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_stream_order(streamorder_str: str) -> int:
+    streamorder_match = g_streamorder_re.match(streamorder_str)
+    if not streamorder_match:
+        raise ValueError(f"Unknown streamorder: {streamorder_str}")
+    return int(streamorder_match.group(1))
+
+
 def get_stream_order(streamorder_str: str) -> int:
-    if isinstance(streamorder_str, str):
-        if "-" in streamorder_str:
-            streamorder_str: str = streamorder_str[streamorder_str.index("-") + 1 :]
-            streamorder: int = int(streamorder_str)
-        else:
-            streamorder: int = int(streamorder_str)
-    else:
+    if not isinstance(streamorder_str, str):
         raise RuntimeError(
             f"Unknown streamorder: {streamorder_str} " f"type:{type(streamorder_str)}"
         )
-    return streamorder
+    return _parse_stream_order(streamorder_str)
+
+
+@dataclasses.dataclass(frozen=True)
+class ExtractionRequest(object):
+    input_filepath: str
+    output_file_dir: str
+    output_file_name: str
+    output_file_suffix: str
+    track_type: str
+    stream_identifier: int = 0
+    exe_file_dir: str = ""
+    verbose: bool = False
+
+    def __post_init__(self):
+        _check_str_param(
+            input_filepath=self.input_filepath,
+            output_file_dir=self.output_file_dir,
+            output_file_name=self.output_file_name,
+            output_file_suffix=self.output_file_suffix,
+            track_type=self.track_type,
+            exe_file_dir=self.exe_file_dir,
+        )
+        try:
+            stream_identifier: int = operator.index(self.stream_identifier)
+        except TypeError:
+            raise TypeError(
+                f"type of stream_identifier must be int "
+                f"instead of {type(self.stream_identifier)}"
+            ) from None
+        object.__setattr__(self, "stream_identifier", stream_identifier)
+        object.__setattr__(self, "verbose", bool(self.verbose))
 
 
 def extract_track_ffmpeg(
@@ -82,73 +375,105 @@ def extract_track_ffmpeg(
     track_type: str,
     stream_identifier=0,
     ffmpeg_exe_file_dir="",
+    verbose=False,
 ) -> str:
-    if not isinstance(input_filepath, str):
-        raise TypeError(
-            f"type of input_filepath must be str " f"instead of {type(input_filepath)}"
-        )
+    extraction_request: ExtractionRequest = ExtractionRequest(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        output_file_name=output_file_name,
+        output_file_suffix=output_file_suffix,
+        track_type=track_type,
+        stream_identifier=stream_identifier,
+        exe_file_dir=ffmpeg_exe_file_dir,
+        verbose=verbose,
+    )
+    return _extract_track_ffmpeg(extraction_request)
 
-    if not isinstance(output_file_dir, str):
-        raise TypeError(
-            f"type of output_file_dir must be str "
-            f"instead of {type(output_file_dir)}"
-        )
 
-    if not isinstance(output_file_name, str):
-        raise TypeError(
-            f"type of output_file_name must be str "
-            f"instead of {type(output_file_name)}"
-        )
+@functools.lru_cache(maxsize=None)
+def _get_extraction_executor() -> concurrent.futures.ThreadPoolExecutor:
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=g_extraction_max_workers, thread_name_prefix="extraction"
+    )
+    atexit.register(executor.shutdown)
+    return executor
 
-    if not isinstance(output_file_suffix, str):
-        raise TypeError(
-            f"type of output_file_suffix must be str "
-            f"instead of {type(output_file_suffix)}"
-        )
 
-    if not isinstance(track_type, str):
-        raise TypeError(
-            f"type of track_type must be str " f"instead of {type(track_type)}"
-        )
+def _release_extraction_slot(future: concurrent.futures.Future):
+    g_extraction_in_flight_semaphore.release()
+
+
+def _wait_futures_first_exception(future_list: list):
+    done_future_set, pending_future_set = concurrent.futures.wait(
+        future_list, return_when=concurrent.futures.FIRST_EXCEPTION
+    )
+    for future in pending_future_set:
+        future.cancel()
+    for future in future_list:
+        if future in done_future_set:
+            future.result()
+
+
+def extract_track_ffmpeg_async(
+    input_filepath: str,
+    output_file_dir: str,
+    output_file_name: str,
+    output_file_suffix: str,
+    track_type: str,
+    stream_identifier=0,
+    ffmpeg_exe_file_dir="",
+    verbose=False,
+    executor=None,
+) -> concurrent.futures.Future:
+    extraction_request: ExtractionRequest = ExtractionRequest(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        output_file_name=output_file_name,
+        output_file_suffix=output_file_suffix,
+        track_type=track_type,
+        stream_identifier=stream_identifier,
+        exe_file_dir=ffmpeg_exe_file_dir,
+        verbose=verbose,
+    )
+    if executor is not None:
+        return executor.submit(_extract_track_ffmpeg, extraction_request)
+
+    g_extraction_in_flight_semaphore.acquire()
+    try:
+        future: concurrent.futures.Future = _get_extraction_executor().submit(
+            _extract_track_ffmpeg, extraction_request
+        )
+    except BaseException:
+        g_extraction_in_flight_semaphore.release()
+        raise
+    future.add_done_callback(_release_extraction_slot)
+    return future
+
+
+def _extract_track_ffmpeg(extraction_request: ExtractionRequest) -> str:
+    input_filepath: str = extraction_request.input_filepath
+    output_file_dir: str = extraction_request.output_file_dir
+    output_file_name: str = extraction_request.output_file_name
+    output_file_suffix: str = extraction_request.output_file_suffix
+    track_type: str = extraction_request.track_type
+    stream_identifier: int = extraction_request.stream_identifier
+    ffmpeg_exe_file_dir: str = extraction_request.exe_file_dir
+    verbose: bool = extraction_request.verbose
 
-    if not isinstance(ffmpeg_exe_file_dir, str):
-        raise TypeError(
-            f"type of ffmpeg_exe_file_dir must be str "
-            f"instead of {type(ffmpeg_exe_file_dir)}"
-        )
     if not os.path.isfile(input_filepath):
         raise FileNotFoundError(
             f"input Matroska file cannot be found with {input_filepath}"
         )
 
-    ffmpeg_exe_filename: str = "ffmpeg.exe"
-    if ffmpeg_exe_file_dir:
-        if not os.path.isdir(ffmpeg_exe_file_dir):
-            raise DirNotFoundError(
-                f"ffmpeg dir cannot be found with {ffmpeg_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(ffmpeg_exe_file_dir)
-        if ffmpeg_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{ffmpeg_exe_filename} cannot be found in " f"{ffmpeg_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({ffmpeg_exe_filename}):
-            raise FileNotFoundError(
-                f"{ffmpeg_exe_filename} cannot be found in " f"environment path"
-            )
+    ffmpeg_exe_filepath: str = _resolve_exe("ffmpeg.exe", ffmpeg_exe_file_dir)
 
-    video_type: str = "video"
-    audio_type: str = "audio"
-    subtitle_type: str = "subtitle"
-    available_type_set: set = {video_type, audio_type, subtitle_type}
-    if track_type not in available_type_set:
+    if track_type not in g_ffmpeg_track_type_frozenset:
+        available_type_set: set = set(g_ffmpeg_track_type_frozenset)
         raise RangeError(
             message=f"value of track_type must in {available_type_set}",
             valid_range=str(available_type_set),
         )
-    if not os.path.exists(output_file_dir):
-        os.makedirs(output_file_dir)
+    os.makedirs(output_file_dir, exist_ok=True)
 
     track_suffix: str = output_file_suffix.replace(".", "")
 
@@ -168,6 +493,11 @@ def extract_track_ffmpeg(
     if os.path.isfile(output_filepath):
         os.remove(output_filepath)
 
+    if os.path.isfile(valid_output_filepath) and not _output_is_complete(
+        valid_output_filepath, -1
+    ):
+        _remove_output_files([valid_output_filepath])
+
     if os.path.isfile(valid_output_filepath):
         skip_info_str: str = (
             f"extraction ffmpeg: {valid_output_filepath} "
@@ -178,70 +508,54 @@ def extract_track_ffmpeg(
         g_logger.log(logging.INFO, skip_info_str)
         return valid_output_filepath
 
-    ffmpeg_exe_filepath: str = os.path.join(ffmpeg_exe_file_dir, ffmpeg_exe_filename)
-    input_key: str = "-i"
-    input_value: str = input_filepath
-    overwrite_key: str = "-y"
-    codec_key: str = "-codec"
-    codec_value: str = "copy"
-    map_key: str = "-map"
-    map_video_symbol: str = "v"
-    map_audio_symbol: str = "a"
-    map_subtitle_symbol: str = "s"
-    no_video_key: str = "-vn"
-    no_audio_key: str = "-an"
-    no_subtitle_key: str = "-sn"
-    no_data_key: str = "-dn"
-    type_symbol: str = ""
-
-    disable_chapter_copy_param_list = ["-map_chapters", "-1"]
-
-    if track_type == video_type:
-        type_symbol = map_video_symbol
-    elif track_type == audio_type:
-        type_symbol = map_audio_symbol
-    elif track_type == subtitle_type:
-        type_symbol = map_subtitle_symbol
-    else:
-        raise RuntimeError("It's impossible to execute this code.")
-
-    map_value = f"0:{type_symbol}:{stream_identifier}"
-    output_value = output_filepath
+    map_value: str = f"0:{g_ffmpeg_map_symbol_dict[track_type]}:{stream_identifier}"
+    partial_output_filepath: str = _get_partial_filepath(output_filepath)
 
     args_list: list = [
         ffmpeg_exe_filepath,
-        input_key,
-        input_value,
-        overwrite_key,
-        codec_key,
-        codec_value,
-        map_key,
+        *(g_ffmpeg_verbose_param_tuple if verbose else g_ffmpeg_quiet_param_tuple),
+        *g_ffmpeg_input_param_dict.get(
+            os.path.splitext(input_filepath)[1].lower(), ()
+        ),
+        "-i",
+        input_filepath,
+        "-y",
+        *g_ffmpeg_stream_copy_param_tuple,
+        "-map",
         map_value,
+        *g_ffmpeg_disable_stream_param_dict[track_type],
+        "-map_chapters",
+        "-1",
+        partial_output_filepath,
     ]
 
-    if track_type == video_type:
-        args_list += [no_audio_key, no_subtitle_key, no_data_key]
-    elif track_type == audio_type:
-        args_list += [no_video_key, no_subtitle_key, no_data_key]
-    elif track_type == subtitle_type:
-        args_list += [no_video_key, no_audio_key, no_data_key]
-
-    args_list += disable_chapter_copy_param_list
-
-    args_list.append(output_value)
-
-    ffmpeg_param_debug_str: str = (
-        f"extraction ffmpeg: param: {subprocess.list2cmdline(args_list)}"
-    )
-    g_logger.log(logging.DEBUG, ffmpeg_param_debug_str)
+    if g_logger.isEnabledFor(logging.DEBUG):
+        ffmpeg_param_debug_str: str = (
+            f"extraction ffmpeg: param: {subprocess.list2cmdline(args_list)}"
+        )
+        g_logger.log(logging.DEBUG, ffmpeg_param_debug_str)
 
     start_info_str: str = (f"extraction ffmpeg: starting extracting {output_filepath}")
 
     print(start_info_str, file=sys.stderr)
     g_logger.log(logging.INFO, start_info_str)
-    process = subprocess.Popen(args_list)
+    try:
+        if verbose:
+            process = subprocess.Popen(args_list)
+        else:
+            process = subprocess.Popen(
+                args_list,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="ignore",
+            )
 
-    process.communicate()
+        _, stderr_text_str = process.communicate()
+    except BaseException:
+        _remove_output_files([partial_output_filepath])
+        raise
 
     return_code = process.returncode
 
@@ -252,110 +566,341 @@ def extract_track_ffmpeg(
         print(end_info_str, file=sys.stderr)
         g_logger.log(logging.INFO, end_info_str)
     else:
-        raise ChildProcessError(
+        error_str: str = (
             f"extraction ffmpeg: extract {output_filepath} unsuccessfully."
         )
-    os.rename(output_filepath, valid_output_filepath)
+        if stderr_text_str:
+            error_str += f"\nstderr:\n{stderr_text_str}"
+        _remove_output_files([partial_output_filepath])
+        raise ChildProcessError(error_str)
+    _replace_partial_file(partial_output_filepath, valid_output_filepath)
     output_filepath = valid_output_filepath
 
     return output_filepath
 
 
-def extract_track_mkvextract(
+def _start_mkvextract(
+    cmd_param_list: list, target_str: str, log_prefix: str = "extraction mkvextract"
+) -> subprocess.Popen:
+    if g_logger.isEnabledFor(logging.DEBUG):
+        mkvextract_param_debug_str: str = (
+            f"{log_prefix}: param: {subprocess.list2cmdline(cmd_param_list)}"
+        )
+        g_logger.log(logging.DEBUG, mkvextract_param_debug_str)
+
+    start_info_str: str = f"{log_prefix}: starting extracting {target_str}"
+
+    print(start_info_str, file=sys.stderr)
+    g_logger.log(logging.INFO, start_info_str)
+
+    process = subprocess.Popen(
+        cmd_param_list, stdout=subprocess.PIPE, bufsize=g_stdout_pipe_buffer_size,
+    )
+    return process
+
+
+def _finish_mkvextract(
+    process: subprocess.Popen,
+    cmd_param_list: list,
+    target_str: str,
+    log_prefix: str = "extraction mkvextract",
+    quiet: bool = False,
+):
+    stdout_bytearray: bytearray = _wait_process_draining_stdout(process, quiet=quiet)
+
+    return_code = process.returncode
+
+    if return_code == 0:
+        end_info_str: str = f"{log_prefix}: extract {target_str} successfully."
+        print(end_info_str, file=sys.stderr)
+        g_logger.log(logging.INFO, end_info_str)
+        return
+
+    stdout_text_str: str = stdout_bytearray.decode("utf-8", errors="replace")
+    if return_code == 1:
+        warning_prefix = "Warning:"
+        warning_text_str = "".join(
+            line
+            for line in stdout_text_str.splitlines(keepends=True)
+            if line.startswith(warning_prefix)
+        )
+        warning_str: str = (
+            f"{log_prefix}: "
+            "mkvextract has output at least one warning, "
+            "but extraction did continue.\n"
+            f"warning:\n{warning_text_str}"
+            f"stdout:\n{stdout_text_str}"
+        )
+        print(warning_str, file=sys.stderr)
+        g_logger.log(logging.WARNING, warning_str)
+    else:
+        error_str = f"{log_prefix}: extract {target_str} unsuccessfully."
+        print(error_str, file=sys.stderr)
+        raise subprocess.CalledProcessError(
+            returncode=return_code,
+            cmd=subprocess.list2cmdline(cmd_param_list),
+            output=stdout_text_str,
+        )
+
+
+def _run_mkvextract(
+    cmd_param_list: list,
+    target_str: str,
+    log_prefix: str = "extraction mkvextract",
+    quiet: bool = False,
+):
+    process: subprocess.Popen = _start_mkvextract(
+        cmd_param_list, target_str=target_str, log_prefix=log_prefix
+    )
+    _finish_mkvextract(
+        process,
+        cmd_param_list,
+        target_str=target_str,
+        log_prefix=log_prefix,
+        quiet=quiet,
+    )
+
+
+def _is_matroska_filepath(filepath: str) -> bool:
+    return os.path.splitext(filepath)[1].lower() in g_matroska_suffix_frozenset
+
+
+def _get_partial_filepath(filepath: str) -> str:
+    filepath_root, extension = os.path.splitext(filepath)
+    return f"{filepath_root}.{os.getpid()}.{threading.get_ident()}.part{extension}"
+
+
+def _get_companion_filepath_list(filepath: str) -> list:
+    filepath_root, extension = os.path.splitext(filepath)
+    return [
+        filepath,
+        *(
+            filepath_root + companion_extension
+            for companion_extension in g_companion_extension_dict.get(
+                extension.lower(), ()
+            )
+        ),
+    ]
+
+
+def _remove_output_files(filepath_list: list):
+    for filepath in filepath_list:
+        for companion_filepath in _get_companion_filepath_list(filepath):
+            if os.path.isfile(companion_filepath):
+                os.remove(companion_filepath)
+
+
+def _replace_partial_file(partial_filepath: str, valid_filepath: str):
+    for partial_companion_filepath, valid_companion_filepath in zip(
+        _get_companion_filepath_list(partial_filepath),
+        _get_companion_filepath_list(valid_filepath),
+    ):
+        if os.path.isfile(partial_companion_filepath):
+            os.replace(partial_companion_filepath, valid_companion_filepath)
+
+
+def _output_is_complete(filepath: str, expected_min_bytes: int) -> bool:
+    if not all(
+        os.path.isfile(companion_filepath)
+        for companion_filepath in _get_companion_filepath_list(filepath)
+    ):
+        return False
+    output_size: int = os.stat(filepath).st_size
+    if expected_min_bytes <= 0:
+        return output_size > 0
+    return output_size >= expected_min_bytes * g_expected_bytes_min_ratio
+
+
+def _is_valid_statistics_writing_date(date_str: str) -> bool:
+    try:
+        writing_date = datetime.datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        return False
+    return writing_date <= datetime.datetime.now(datetime.timezone.utc).replace(
+        tzinfo=None
+    )
+
+
+def _get_mkv_track_expected_bytes(track_info_dict: dict, output_filepath: str) -> int:
+    if output_filepath.endswith(".idx"):
+        return -1
+    properties_dict: dict = track_info_dict.get("properties", {})
+    if (
+        "tag_number_of_bytes" not in properties_dict
+        or properties_dict.get("content_encoding_algorithms")
+        or not _is_valid_statistics_writing_date(
+            properties_dict.get("tag__statistics_writing_date_utc")
+        )
+    ):
+        return -1
+    return int(properties_dict["tag_number_of_bytes"])
+
+
+def _iter_media_info_prefetched(filepath_list: list):
+    if not filepath_list:
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        media_info_future = executor.submit(_get_media_info_list, filepath_list[0])
+        for index, filepath in enumerate(filepath_list):
+            media_info_list: list = media_info_future.result()
+            if index + 1 < len(filepath_list):
+                media_info_future = executor.submit(
+                    _get_media_info_list, filepath_list[index + 1]
+                )
+            yield filepath, media_info_list
+
+
+def _run_mkvextract_plan(
     input_filepath: str,
-    output_file_dir: str,
-    output_file_name: str,
-    output_file_suffix: str,
-    track_type: str,
-    track_index: int,
-    disable_filename_index_bool: bool = False,
+    mode_param_list: list,
+    partial_output_filepath_dict: dict,
+    target_str: str,
     mkvextract_exe_file_dir: str = "",
-) -> str:
-    if not isinstance(input_filepath, str):
-        raise TypeError(
-            f"type of input_filepath must be str " f"instead of {type(input_filepath)}"
+    log_prefix: str = "extraction mkvextract",
+    quiet: bool = False,
+):
+    mkvextract_exe_filepath: str = _resolve_exe(
+        "mkvextract.exe", mkvextract_exe_file_dir
+    )
+    cmd_param_list: list = [mkvextract_exe_filepath, input_filepath, *mode_param_list]
+    try:
+        _run_mkvextract(
+            cmd_param_list, target_str=target_str, log_prefix=log_prefix, quiet=quiet
         )
+    except BaseException:
+        _remove_output_files(list(partial_output_filepath_dict.keys()))
+        raise
 
-    if not isinstance(output_file_dir, str):
-        raise TypeError(
-            f"type of output_file_dir must be str "
-            f"instead of {type(output_file_dir)}"
+    for partial_filepath, valid_filepath in partial_output_filepath_dict.items():
+        _replace_partial_file(partial_filepath, valid_filepath)
+
+
+def _plan_tracks_mkvextract(
+    input_filepath: str,
+    track_output_filepath_dict: dict,
+    mkvextract_exe_file_dir: str = "",
+) -> tuple:
+    mkv_track_id_dict: dict = _mkv_track_id_dict(
+        input_filepath, mkvextract_exe_file_dir
+    )
+    valid_output_filepath_dict: dict = {}
+    partial_output_filepath_dict: dict = {}
+    output_param_list: list = []
+    for track_index, output_filepath in track_output_filepath_dict.items():
+        output_file_dir, output_filename_fullname = os.path.split(output_filepath)
+        valid_output_filepath: str = os.path.join(
+            output_file_dir, get_filename_with_valid_mark(output_filename_fullname)
         )
+        valid_output_filepath_dict[track_index] = valid_output_filepath
 
-    if not isinstance(output_file_name, str):
-        raise TypeError(
-            f"type of output_file_name must be str "
-            f"instead of {type(output_file_name)}"
+        if os.path.isfile(output_filepath):
+            os.remove(output_filepath)
+
+        expected_min_bytes: int = _get_mkv_track_expected_bytes(
+            mkv_track_id_dict[track_index], output_filepath
         )
+        if os.path.isfile(valid_output_filepath) and not _output_is_complete(
+            valid_output_filepath, expected_min_bytes
+        ):
+            _remove_output_files([valid_output_filepath])
 
-    if not isinstance(output_file_suffix, str):
-        raise TypeError(
-            f"type of output_file_suffix must be str "
-            f"instead of {type(output_file_suffix)}"
+        if os.path.isfile(valid_output_filepath):
+            skip_info_str: str = (
+                f"extraction mkvextract: {valid_output_filepath} "
+                f"already existed, skip extraction."
+            )
+
+            print(skip_info_str, file=sys.stderr)
+            g_logger.log(logging.INFO, skip_info_str)
+            continue
+
+        partial_output_filepath: str = _get_partial_filepath(output_filepath)
+        partial_output_filepath_dict[partial_output_filepath] = valid_output_filepath
+        output_param_list.append(f"{track_index}:{partial_output_filepath}")
+
+    return valid_output_filepath_dict, partial_output_filepath_dict, output_param_list
+
+
+def _extract_tracks_mkvextract(
+    input_filepath: str,
+    track_output_filepath_dict: dict,
+    mkvextract_exe_file_dir: str = "",
+) -> dict:
+    (
+        valid_output_filepath_dict,
+        partial_output_filepath_dict,
+        output_param_list,
+    ) = _plan_tracks_mkvextract(
+        input_filepath, track_output_filepath_dict, mkvextract_exe_file_dir
+    )
+
+    if partial_output_filepath_dict:
+        _run_mkvextract_plan(
+            input_filepath,
+            ["tracks", *output_param_list],
+            partial_output_filepath_dict,
+            target_str=str(list(partial_output_filepath_dict.values())),
+            mkvextract_exe_file_dir=mkvextract_exe_file_dir,
         )
 
-    if not isinstance(track_type, str):
-        raise TypeError(f"type of track_type must be str instead of {type(track_type)}")
+    return valid_output_filepath_dict
+
+
+def extract_track_mkvextract(
+    input_filepath: str,
+    output_file_dir: str,
+    output_file_name: str,
+    output_file_suffix: str,
+    track_type: str,
+    track_index: int,
+    disable_filename_index_bool: bool = False,
+    mkvextract_exe_file_dir: str = "",
+    quiet: bool = False,
+) -> str:
+    _check_str_param(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        output_file_name=output_file_name,
+        output_file_suffix=output_file_suffix,
+        track_type=track_type,
+        mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+    )
 
     if not isinstance(track_index, int):
         raise TypeError(
             f"type of track_index must be int " f"instead of {type(track_index)}"
         )
 
-    if not isinstance(mkvextract_exe_file_dir, str):
-        raise TypeError(
-            f"type of mkvextract_exe_file_dir must be str "
-            f"instead of {type(mkvextract_exe_file_dir)}"
-        )
     if not os.path.isfile(input_filepath):
         raise FileNotFoundError(
             f"input Matroska file cannot be found with {input_filepath}"
         )
 
-    mkv_suffix_set: set = {".mkv", ".mka", ".mks"}
-    _, extension = os.path.splitext(input_filepath)
-    if extension not in mkv_suffix_set:
+    if not _is_matroska_filepath(input_filepath):
         raise TypeError(
             f"format of input_filepath must be Matroska "
-            f"and it has to end with {mkv_suffix_set}"
+            f"and it has to end with {set(g_matroska_suffix_frozenset)}"
         )
 
-    mkvextract_exe_filename: str = "mkvextract.exe"
-    if mkvextract_exe_file_dir:
-        if not os.path.isdir(mkvextract_exe_file_dir):
-            raise DirNotFoundError(
-                f"mkvextract dir cannot be found with " f"{mkvextract_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(mkvextract_exe_file_dir)
-        if mkvextract_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in "
-                f"{mkvextract_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({mkvextract_exe_filename}):
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in " f"environment path"
-            )
+    mkvextract_exe_filepath: str = _resolve_exe(
+        "mkvextract.exe", mkvextract_exe_file_dir
+    )
 
     video_type: str = "video"
     audio_type: str = "audio"
     text_type: str = "text"
     timestamp_type: str = "timecode"
-    available_type_set: set = {
-        video_type,
-        audio_type,
-        text_type,
-        timestamp_type,
-    }
-    if track_type not in available_type_set:
+    if track_type not in g_mkv_track_type_frozenset:
+        available_type_set: set = set(g_mkv_track_type_frozenset)
         raise RangeError(
             message=f"value of track_type must in {available_type_set}",
             valid_range=str(available_type_set),
         )
-    media_info_list: list = MediaInfo.parse(input_filepath).to_data()["tracks"]
+    mkv_track_id_dict: dict = _mkv_track_id_dict(
+        input_filepath, mkvextract_exe_file_dir
+    )
     min_index: int = 0
-    max_index: int = len(media_info_list) - 2
+    max_index: int = len(mkv_track_id_dict) - 1
     if track_index < min_index or track_index > max_index:
         raise RangeError(
             message=f"value of track_index must in [{min_index},{max_index}]",
@@ -363,19 +908,16 @@ def extract_track_mkvextract(
         )
 
     if track_type != timestamp_type:
-        index_track_info_dict: dict = next(
-            track_info
-            for track_info in media_info_list[1:]
-            if track_info["streamorder"] == str(track_index)
+        index_track_info_dict: dict = mkv_track_id_dict[track_index]
+        index_track_type: str = g_mkvmerge_track_type_dict.get(
+            index_track_info_dict["type"], index_track_info_dict["type"]
         )
-        index_track_type: str = index_track_info_dict["track_type"].lower()
         if index_track_type != track_type:
             raise ValueError(
                 f"stream in {track_index} track is not {track_type} "
                 f"but {index_track_type} "
             )
-    if not os.path.exists(output_file_dir):
-        os.makedirs(output_file_dir)
+    os.makedirs(output_file_dir, exist_ok=True)
 
     track_suffix: str = output_file_suffix.replace(".", "")
 
@@ -398,6 +940,14 @@ def extract_track_mkvextract(
     if os.path.isfile(output_filepath):
         os.remove(output_filepath)
 
+    if track_type != timestamp_type and not _output_is_complete(
+        valid_output_filepath,
+        _get_mkv_track_expected_bytes(
+            mkv_track_id_dict[track_index], valid_output_filepath
+        ),
+    ):
+        _remove_output_files([valid_output_filepath])
+
     if os.path.isfile(valid_output_filepath):
         skip_info_str: str = (
             f"extraction mkvextract: {valid_output_filepath} "
@@ -408,10 +958,6 @@ def extract_track_mkvextract(
         g_logger.log(logging.INFO, skip_info_str)
         return valid_output_filepath
 
-    mkvextract_exe_filepath: str = os.path.join(
-        mkvextract_exe_file_dir, mkvextract_exe_filename
-    )
-
     input_value: str = input_filepath
 
     if track_type in {video_type, audio_type, text_type}:
@@ -421,7 +967,8 @@ def extract_track_mkvextract(
     else:
         raise ValueError
 
-    output_value: str = f"{track_index}:{output_filepath}"
+    partial_output_filepath: str = _get_partial_filepath(output_filepath)
+    output_value: str = f"{track_index}:{partial_output_filepath}"
 
     cmd_param_list: list = [
         mkvextract_exe_filepath,
@@ -430,80 +977,37 @@ def extract_track_mkvextract(
         output_value,
     ]
 
-    mkvextract_param_debug_str: str = (
-        f"multiplex mkvextract: param: {subprocess.list2cmdline(cmd_param_list)}"
-    )
-    g_logger.log(logging.DEBUG, mkvextract_param_debug_str)
-
-    start_info_str: str = (
-        f"multiplex mkvextract: starting extracting {output_filepath}"
-    )
-
-    print(start_info_str, file=sys.stderr)
-    g_logger.log(logging.INFO, start_info_str)
+    try:
+        _run_mkvextract(cmd_param_list, target_str=output_filepath, quiet=quiet)
+    except BaseException:
+        _remove_output_files([partial_output_filepath])
+        raise
 
-    process = subprocess.Popen(
-        cmd_param_list,
-        stdout=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-        errors="ignore",
-    )
-
-    stdout_lines: list = []
-    while process.poll() is None:
-        stdout_line = process.stdout.readline()
-        stdout_lines.append(stdout_line)
-        print(stdout_line, end="", file=sys.stderr)
-
-    return_code = process.returncode
-
-    if return_code == 0:
-        end_info_str: str = (
-            f"extraction mkvextract: " f"extract {output_filepath} successfully."
-        )
-        print(end_info_str, file=sys.stderr)
-        g_logger.log(logging.INFO, end_info_str)
-    elif return_code == 1:
-        warning_prefix = "Warning:"
-        warning_text_str = "".join(
-            line for line in stdout_lines if line.startswith(warning_prefix)
-        )
-        stdout_text_str = "".join(stdout_lines)
-        warning_str: str = (
-            "extraction mkvextract: "
-            "mkvextract has output at least one warning, "
-            "but extraction did continue.\n"
-            f"warning:\n{warning_text_str}"
-            f"stdout:\n{stdout_text_str}"
-        )
-        print(warning_str, file=sys.stderr)
-        g_logger.log(logging.WARNING, warning_str)
-    else:
-        error_str = (
-            f"extraction mkvextract: " f"extract {output_filepath} unsuccessfully."
-        )
-        print(error_str, file=sys.stderr)
-        raise subprocess.CalledProcessError(
-            returncode=return_code,
-            cmd=subprocess.list2cmdline(cmd_param_list),
-            output=stdout_text_str,
-        )
-    os.rename(output_filepath, valid_output_filepath)
+    _replace_partial_file(partial_output_filepath, valid_output_filepath)
     output_filepath = valid_output_filepath
 
     return output_filepath
 
 
-def extract_mkv_video_timecode(filepath: str, output_dir: str, output_name: str) -> str:
-    if not os.path.isdir(output_dir):
-        os.makedirs(output_dir)
+def extract_mkv_video_timecode(
+    filepath: str,
+    output_dir: str,
+    output_name: str,
+    mkvmerge_exe_file_dir: str = "",
+    mkvextract_exe_file_dir: str = "",
+) -> str:
+    os.makedirs(output_dir, exist_ok=True)
     timecode_suffix: str = "txt"
-    media_info_list: list = MediaInfo.parse(filepath).to_data()["tracks"]
-    video_info_dict: dict = next(
-        (track for track in media_info_list if track["track_type"] == "Video"), None,
+    video_sream_order: int = next(
+        (
+            track_info["id"]
+            for track_info in _mkv_identify(filepath, mkvmerge_exe_file_dir)["tracks"]
+            if track_info["type"] == "video"
+        ),
+        None,
     )
-    video_sream_order: int = int(video_info_dict["streamorder"])
+    if video_sream_order is None:
+        raise ValueError(f"{filepath} has no video track to extract timecode from!")
     output_filepath: str = extract_track_mkvextract(
         input_filepath=filepath,
         output_file_dir=output_dir,
@@ -511,6 +1015,7 @@ def extract_mkv_video_timecode(filepath: str, output_dir: str, output_name: str)
         output_file_suffix=timecode_suffix,
         track_type="timecode",
         track_index=video_sream_order,
+        mkvextract_exe_file_dir=mkvextract_exe_file_dir,
     )
 
     output_filepath = mkv_timecode_2_standard_timecode(output_filepath)
@@ -518,321 +1023,404 @@ def extract_mkv_video_timecode(filepath: str, output_dir: str, output_name: str)
     return output_filepath
 
 
-def extract_all_subtitles(
-    input_filepath: str,
-    output_file_dir: str,
-    output_file_name: str,
-    mkvextract_exe_file_dir="",
-    ffmpeg_exe_file_dir="",
-) -> list:
-    if not isinstance(input_filepath, str):
-        raise TypeError(
-            f"type of input_filepath must be str " f"instead of {type(input_filepath)}"
-        )
+def _get_subtitle_track_suffix(text_info_dict: dict) -> str:
+    text_format: str = text_info_dict["format"].lower()
+    return g_subtitle_format_suffix_dict.get(text_format, text_format)
 
-    if not isinstance(output_file_dir, str):
-        raise TypeError(
-            f"type of output_file_dir must be str "
-            f"instead of {type(output_file_dir)}"
-        )
 
-    if not isinstance(output_file_name, str):
-        raise TypeError(
-            f"type of output_file_name must be str "
-            f"instead of {type(output_file_name)}"
-        )
+def _get_audio_track_suffix(audio_info_dict: dict) -> str:
+    audio_format: str = audio_info_dict["format"].lower()
+    if audio_format != "mpeg audio":
+        return g_audio_format_suffix_dict.get(audio_format, audio_format)
 
-    if not isinstance(mkvextract_exe_file_dir, str):
-        raise TypeError(
-            f"type of mkvextract_exe_file_dir must be str "
-            f"instead of {type(mkvextract_exe_file_dir)}"
-        )
-    if not os.path.isfile(input_filepath):
-        raise FileNotFoundError(
-            f"input Matroska file cannot be found with {input_filepath}"
+    if "format_profile" in audio_info_dict:
+        format_profile = audio_info_dict["format_profile"].lower()
+        if format_profile not in g_mpeg_audio_profile_suffix_dict:
+            raise RuntimeError(f"Unknown format_profile: {format_profile}")
+        return g_mpeg_audio_profile_suffix_dict[format_profile]
+
+    if audio_info_dict["codec_id_hint"].lower() != "mp3":
+        raise RuntimeError(
+            f"Unknown codec_id_hint: " f"{audio_info_dict['codec_id_hint']}"
         )
+    return "mp3"
 
-    mkv_suffix_set: set = {".mkv", ".mka"}
 
-    mkvextract_exe_filename: str = "mkvextract.exe"
-    if mkvextract_exe_file_dir:
-        if not os.path.isdir(mkvextract_exe_file_dir):
-            raise DirNotFoundError(
-                f"mkvextract dir cannot be found with " f"{mkvextract_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(mkvextract_exe_file_dir)
-        if mkvextract_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in "
-                f"{mkvextract_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({mkvextract_exe_filename}):
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in " f"environment path"
-            )
-
-    if not isinstance(ffmpeg_exe_file_dir, str):
-        raise TypeError(
-            f"type of ffmpeg_exe_file_dir must be str "
-            f"instead of {type(ffmpeg_exe_file_dir)}"
-        )
-    if not os.path.isfile(input_filepath):
-        raise FileNotFoundError(
-            f"input Matroska file cannot be found with {input_filepath}"
-        )
+def _get_text_track_file(
+    output_filepath: str, track_index: int, text_info_dict: dict
+) -> TextTrackFile:
+    text_track_file: TextTrackFile = TextTrackFile(
+        filepath=output_filepath,
+        track_index=track_index,
+        track_format=text_info_dict["format"].lower(),
+        duration_ms=int(float(text_info_dict["duration"]))
+        if "duration" in text_info_dict
+        else -1,
+        bit_rate_bps=int(text_info_dict["bit_rate"])
+        if "bit_rate" in text_info_dict
+        else -1,
+        delay_ms=int(float(text_info_dict["delay"]))
+        if "delay" in text_info_dict
+        else 0,
+        stream_size_byte=int(text_info_dict["stream_size"])
+        if "stream_size" in text_info_dict
+        else -1,
+        title=text_info_dict.get("title", ""),
+        language=text_info_dict.get("language", ""),
+        default_bool=g_yes_no_bool_dict.get(text_info_dict.get("default", "No"), False),
+        forced_bool=g_yes_no_bool_dict.get(text_info_dict.get("forced", "No"), False),
+    )
+    return text_track_file
 
-    ffmpeg_exe_filename: str = "ffmpeg.exe"
-    if ffmpeg_exe_file_dir:
-        if not os.path.isdir(ffmpeg_exe_file_dir):
-            raise DirNotFoundError(
-                f"ffmpeg dir cannot be found with {ffmpeg_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(ffmpeg_exe_file_dir)
-        if ffmpeg_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{ffmpeg_exe_filename} cannot be found in " f"{ffmpeg_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({ffmpeg_exe_filename}):
-            raise FileNotFoundError(
-                f"{ffmpeg_exe_filename} cannot be found in " f"environment path"
-            )
-    if not os.path.isdir(output_file_dir):
-        os.makedirs(output_file_dir)
 
-    media_info_list: list = MediaInfo.parse(input_filepath).to_data()["tracks"]
-    text_info_list: list = [
-        track for track in media_info_list if track["track_type"].lower() == "text"
-    ]
-    if not text_info_list:
-        return tuple()
+def _get_mkv_subtitle_output_filepath_dict(
+    output_file_dir: str, output_file_name: str, index_text_info_dict: dict
+) -> dict:
+    output_filepath_prefix: str = (
+        os.path.join(output_file_dir, output_file_name) + "_index_"
+    )
+    return {
+        track_index: f"{output_filepath_prefix}{track_index}_index_{track_index}."
+        f"{_get_subtitle_track_suffix(text_info_dict)}"
+        for track_index, text_info_dict in index_text_info_dict.items()
+    }
 
-    text_track_file_list: list = []
-    for text_track_index, text_info_dict in enumerate(text_info_list):
-        track_index: int = get_stream_order(text_info_dict["streamorder"])
 
-        text_format: str = text_info_dict["format"].lower()
-        track_suffix: str = text_format
-        if text_format == "pgs":
-            track_suffix = "sup"
-        elif text_format == "vobsub":
-            track_suffix = "idx"
-        elif text_format == "utf-8":
-            track_suffix = "srt"
+def _extract_tracks_ffmpeg(
+    input_filepath: str,
+    track_type: str,
+    track_output_filepath_dict: dict,
+    ffmpeg_exe_file_dir: str = "",
+) -> dict:
+    ffmpeg_exe_filepath: str = _resolve_exe("ffmpeg.exe", ffmpeg_exe_file_dir)
+
+    valid_output_filepath_dict: dict = {}
+    partial_output_filepath_dict: dict = {}
+    output_param_list: list = []
+    for stream_identifier, output_filepath in track_output_filepath_dict.items():
+        output_file_dir, output_filename_fullname = os.path.split(output_filepath)
+        valid_output_filepath: str = os.path.join(
+            output_file_dir, get_filename_with_valid_mark(output_filename_fullname)
+        )
+        valid_output_filepath_dict[stream_identifier] = valid_output_filepath
 
-        output_filename: str = (f"{output_file_name}_index_{track_index}")
+        if os.path.isfile(output_filepath):
+            os.remove(output_filepath)
 
-        if any(input_filepath.endswith(mkv_suffix) for mkv_suffix in mkv_suffix_set):
+        if os.path.isfile(valid_output_filepath) and not _output_is_complete(
+            valid_output_filepath, -1
+        ):
+            _remove_output_files([valid_output_filepath])
 
-            output_filepath: str = extract_track_mkvextract(
-                input_filepath=input_filepath,
-                output_file_dir=output_file_dir,
-                output_file_name=output_filename,
-                output_file_suffix=track_suffix,
-                track_type="text",
-                track_index=track_index,
+        if os.path.isfile(valid_output_filepath):
+            skip_info_str: str = (
+                f"extraction ffmpeg: {valid_output_filepath} "
+                f"already existed, skip extraction."
             )
-        else:
-            output_filepath: str = extract_track_ffmpeg(
-                input_filepath=output_filename,
-                output_file_dir=output_file_dir,
-                output_file_name=output_filename,
-                output_file_suffix=track_suffix,
-                track_type="subtitle",
-                stream_identifier=int(text_info_dict["stream_identifier"]),
-                ffmpeg_exe_file_dir=ffmpeg_exe_file_dir,
+
+            print(skip_info_str, file=sys.stderr)
+            g_logger.log(logging.INFO, skip_info_str)
+            continue
+
+        partial_output_filepath: str = _get_partial_filepath(output_filepath)
+        partial_output_filepath_dict[partial_output_filepath] = valid_output_filepath
+        output_param_list.extend(
+            (
+                *g_ffmpeg_stream_copy_param_tuple,
+                "-map",
+                f"0:{g_ffmpeg_map_symbol_dict[track_type]}:{stream_identifier}",
+                *g_ffmpeg_disable_stream_param_dict[track_type],
+                "-map_chapters",
+                "-1",
+                partial_output_filepath,
             )
+        )
 
-        text_track_file: TextTrackFile = TextTrackFile(
-            filepath=output_filepath,
-            track_index=track_index,
-            track_format=text_info_dict["format"].lower(),
-            duration_ms=int(float(text_info_dict["duration"]))
-            if "duration" in text_info_dict
-            else -1,
-            bit_rate_bps=int(text_info_dict["bit_rate"])
-            if "bit_rate" in text_info_dict
-            else -1,
-            delay_ms=int(float(text_info_dict["delay"]))
-            if "delay" in text_info_dict
-            else 0,
-            stream_size_byte=int(text_info_dict["stream_size"])
-            if "stream_size" in text_info_dict
-            else -1,
-            title=text_info_dict["title"] if "title" in text_info_dict.keys() else "",
-            language=text_info_dict["language"]
-            if "language" in text_info_dict.keys()
-            else "",
-            default_bool=False
-            if "default" not in text_info_dict.keys()
-            else (True if text_info_dict["default"].lower() == "yes" else False),
-            forced_bool=False
-            if "default" not in text_info_dict.keys()
-            else (True if text_info_dict["forced"].lower() == "yes" else False),
-        )
-        text_track_file_list.append(text_track_file)
-
-    return text_track_file_list
+    if not partial_output_filepath_dict:
+        return valid_output_filepath_dict
 
+    args_list: list = [
+        ffmpeg_exe_filepath,
+        *g_ffmpeg_quiet_param_tuple,
+        *g_ffmpeg_input_param_dict.get(os.path.splitext(input_filepath)[1].lower(), ()),
+        "-i",
+        input_filepath,
+        "-y",
+        *output_param_list,
+    ]
 
-def extract_all_attachments(
-    input_filepath: str, output_file_dir: str, mkvextract_exe_file_dir=""
-) -> tuple:
-    if not isinstance(input_filepath, str):
-        raise TypeError(
-            f"type of input_filepath must be str " f"instead of {type(input_filepath)}"
+    if g_logger.isEnabledFor(logging.DEBUG):
+        ffmpeg_param_debug_str: str = (
+            f"extraction ffmpeg: param: {subprocess.list2cmdline(args_list)}"
         )
+        g_logger.log(logging.DEBUG, ffmpeg_param_debug_str)
 
-    if not isinstance(output_file_dir, str):
-        raise TypeError(
-            f"type of output_file_dir must be str "
-            f"instead of {type(output_file_dir)}"
-        )
+    target_str: str = str(list(partial_output_filepath_dict.values()))
+    start_info_str: str = f"extraction ffmpeg: starting extracting {target_str}"
 
-    if not isinstance(mkvextract_exe_file_dir, str):
-        raise TypeError(
-            f"type of mkvextract_exe_file_dir must be str "
-            f"instead of {type(mkvextract_exe_file_dir)}"
-        )
-    if not os.path.isfile(input_filepath):
-        raise FileNotFoundError(
-            f"input Matroska file cannot be found with {input_filepath}"
-        )
+    print(start_info_str, file=sys.stderr)
+    g_logger.log(logging.INFO, start_info_str)
+    try:
+        process = subprocess.Popen(
+            args_list,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="ignore",
+        )
+        _, stderr_text_str = process.communicate()
+    except BaseException:
+        _remove_output_files(list(partial_output_filepath_dict.keys()))
+        raise
+
+    if process.returncode != 0:
+        error_str: str = f"extraction ffmpeg: extract {target_str} unsuccessfully."
+        print(error_str, file=sys.stderr)
+        if stderr_text_str:
+            error_str += f"\nstderr:\n{stderr_text_str}"
+        _remove_output_files(list(partial_output_filepath_dict.keys()))
+        raise ChildProcessError(error_str)
 
-    mkv_suffix: str = ".mkv"
-    if not input_filepath.endswith(mkv_suffix):
-        raise TypeError(
-            f"format of input_filepath must be Matroska "
-            f"and it has to end with {mkv_suffix}"
+    for partial_output_filepath in partial_output_filepath_dict:
+        _replace_partial_file(
+            partial_output_filepath,
+            partial_output_filepath_dict[partial_output_filepath],
         )
 
-    mkvextract_exe_filename: str = "mkvextract.exe"
-    if mkvextract_exe_file_dir:
-        if not os.path.isdir(mkvextract_exe_file_dir):
-            raise DirNotFoundError(
-                f"ffmpeg dir cannot be found with {mkvextract_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(mkvextract_exe_file_dir)
-        if mkvextract_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in "
-                f"{mkvextract_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({mkvextract_exe_filename}):
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in " f"environment path"
-            )
-    if not os.path.isdir(output_file_dir):
-        os.makedirs(output_file_dir)
+    end_info_str: str = f"extraction ffmpeg: extract {target_str} successfully."
+    print(end_info_str, file=sys.stderr)
+    g_logger.log(logging.INFO, end_info_str)
 
-    media_info_list: list = MediaInfo.parse(input_filepath).to_data()["tracks"]
-    general_info_dict: dict = next(
-        (track for track in media_info_list if track["track_type"] == "General"), None,
-    )
+    return valid_output_filepath_dict
 
-    attachment_key: str = "attachments"
-    general_info_key_set: set = set(general_info_dict.keys())
-    if attachment_key not in general_info_key_set:
-        return tuple()
-    attachment_filename_list: list = split_mediainfo_str2list(
-        general_info_dict[attachment_key]
+
+def _extract_subtitle_tracks_ffmpeg(
+    input_filepath: str,
+    output_file_dir: str,
+    output_file_name: str,
+    text_info_list: list,
+    ffmpeg_exe_file_dir: str,
+) -> list:
+    subtitle_type: str = "subtitle"
+
+    track_output_filepath_dict: dict = {}
+    for text_info_dict in text_info_list:
+        track_index: int = get_stream_order(text_info_dict["streamorder"])
+        stream_identifier: int = int(text_info_dict["stream_identifier"])
+        output_filename_fullname: str = (
+            f"{output_file_name}_index_{track_index}_"
+            f"{subtitle_type}_index_{stream_identifier}."
+            f"{_get_subtitle_track_suffix(text_info_dict)}"
+        )
+        track_output_filepath_dict[stream_identifier] = os.path.join(
+            output_file_dir, output_filename_fullname
+        )
+
+    valid_output_filepath_dict: dict = _extract_tracks_ffmpeg(
+        input_filepath=input_filepath,
+        track_type=subtitle_type,
+        track_output_filepath_dict=track_output_filepath_dict,
+        ffmpeg_exe_file_dir=ffmpeg_exe_file_dir,
     )
 
-    output_attachment_filepath_list: list = [
-        os.path.join(output_file_dir, filename) for filename in attachment_filename_list
+    return [
+        _get_text_track_file(
+            valid_output_filepath_dict[int(text_info_dict["stream_identifier"])],
+            get_stream_order(text_info_dict["streamorder"]),
+            text_info_dict,
+        )
+        for text_info_dict in text_info_list
     ]
 
-    mkvextract_exe_filepath: str = os.path.join(
-        mkvextract_exe_file_dir, mkvextract_exe_filename
+
+def extract_all_subtitles(
+    input_filepath: str,
+    output_file_dir: str,
+    output_file_name: str,
+    mkvextract_exe_file_dir="",
+    ffmpeg_exe_file_dir="",
+) -> list:
+    _check_str_param(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        output_file_name=output_file_name,
+        mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+        ffmpeg_exe_file_dir=ffmpeg_exe_file_dir,
     )
+    if not os.path.isfile(input_filepath):
+        raise FileNotFoundError(
+            f"input Matroska file cannot be found with {input_filepath}"
+        )
 
-    attachment_key: str = "attachments"
-    attachment_value_template: str = "{attachment_id}:{output_path}"
+    _resolve_exe("mkvextract.exe", mkvextract_exe_file_dir)
 
-    cmd_param_list: list = [
-        mkvextract_exe_filepath,
-        input_filepath,
-        attachment_key,
+    _resolve_exe("ffmpeg.exe", ffmpeg_exe_file_dir)
+    os.makedirs(output_file_dir, exist_ok=True)
+
+    media_info_list: list = _get_media_info_list(input_filepath)
+    text_info_list: list = [
+        track for track in media_info_list if track["track_type"].lower() == "text"
     ]
+    if not text_info_list:
+        return tuple()
 
-    for index, filepath in enumerate(output_attachment_filepath_list):
-        cmd_param_list.append(
-            attachment_value_template.format(
-                attachment_id=index + 1, output_path=filepath
-            )
+    if _is_matroska_filepath(input_filepath):
+        index_text_info_dict: dict = {
+            get_stream_order(text_info_dict["streamorder"]): text_info_dict
+            for text_info_dict in text_info_list
+        }
+        track_output_filepath_dict: dict = _get_mkv_subtitle_output_filepath_dict(
+            output_file_dir, output_file_name, index_text_info_dict
         )
 
-    param_debug_str: str = (
-        f"extraction mkvextract attachment: param: "
-        f"{subprocess.list2cmdline(cmd_param_list)}"
-    )
-    g_logger.log(logging.DEBUG, param_debug_str)
+        valid_output_filepath_dict: dict = _extract_tracks_mkvextract(
+            input_filepath=input_filepath,
+            track_output_filepath_dict=track_output_filepath_dict,
+            mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+        )
 
-    start_info_str: str = (
-        f"extraction mkvetract attachment: "
-        f"start to extract {attachment_filename_list} "
-        f"from {input_filepath}"
+        text_track_file_list: list = [
+            _get_text_track_file(
+                valid_output_filepath_dict[track_index], track_index, text_info_dict
+            )
+            for track_index, text_info_dict in index_text_info_dict.items()
+        ]
+        return text_track_file_list
+
+    return _extract_subtitle_tracks_ffmpeg(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        output_file_name=output_file_name,
+        text_info_list=text_info_list,
+        ffmpeg_exe_file_dir=ffmpeg_exe_file_dir,
     )
-    print(start_info_str, file=sys.stderr)
-    g_logger.log(logging.INFO, start_info_str)
 
-    process = subprocess.Popen(
-        cmd_param_list,
-        stdout=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-        errors="ignore",
-    )
 
-    stdout_lines: list = []
-    while process.poll() is None:
-        stdout_line = process.stdout.readline()
-        stdout_lines.append(stdout_line)
-        print(stdout_line, end="", file=sys.stderr)
+def _plan_attachments_mkvextract(
+    input_filepath: str, output_file_dir: str, mkvextract_exe_file_dir: str = ""
+) -> tuple:
+    attachment_info_list: list = _mkv_identify(
+        input_filepath, mkvextract_exe_file_dir
+    ).get("attachments", [])
+
+    output_file_dir_prefix: str = os.path.join(output_file_dir, "")
+    output_attachment_filepath_list: list = []
+    partial_attachment_filepath_dict: dict = {}
+    output_param_list: list = []
+    for attachment_info in attachment_info_list:
+        filepath: str = output_file_dir_prefix + attachment_info["file_name"]
+        output_attachment_filepath_list.append(filepath)
+        if _output_is_complete(filepath, attachment_info.get("size", -1)):
+            continue
+        partial_filepath: str = _get_partial_filepath(filepath)
+        partial_attachment_filepath_dict[partial_filepath] = filepath
+        output_param_list.append(f"{attachment_info['id']}:{partial_filepath}")
+
+    return (
+        output_attachment_filepath_list,
+        partial_attachment_filepath_dict,
+        output_param_list,
+    )
 
-    return_code = process.returncode
 
-    if return_code == 0:
-        end_info_str: str = (
-            f"extraction mkvextract attachment: "
-            f"extract {attachment_filename_list} "
-            f"from {input_filepath} successfully."
-        )
-        print(end_info_str, file=sys.stderr)
-        g_logger.log(logging.INFO, end_info_str)
-    elif return_code == 1:
-        warning_prefix = "Warning:"
-        warning_text_str = "".join(
-            line for line in stdout_lines if line.startswith(warning_prefix)
+def extract_all_attachments(
+    input_filepath: str,
+    output_file_dir: str,
+    mkvextract_exe_file_dir="",
+    quiet: bool = False,
+) -> tuple:
+    _check_str_param(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+    )
+    if not os.path.isfile(input_filepath):
+        raise FileNotFoundError(
+            f"input Matroska file cannot be found with {input_filepath}"
         )
-        stdout_text_str = "".join(stdout_lines)
-        warning_str: str = (
-            "extraction mkvextract attachment: "
-            "mkvextract has output at least one warning, "
-            "but extraction did continue.\n"
-            f"warning:\n{warning_text_str}"
-            f"stdout:\n{stdout_text_str}"
+
+    if not _is_matroska_filepath(input_filepath):
+        raise TypeError(
+            f"format of input_filepath must be Matroska "
+            f"and it has to end with {set(g_matroska_suffix_frozenset)}"
         )
-        print(warning_str, file=sys.stderr)
-        g_logger.log(logging.WARNING, warning_str)
-    else:
-        error_str = (
+
+    _resolve_exe("mkvextract.exe", mkvextract_exe_file_dir)
+    os.makedirs(output_file_dir, exist_ok=True)
+
+    (
+        output_attachment_filepath_list,
+        partial_attachment_filepath_dict,
+        output_param_list,
+    ) = _plan_attachments_mkvextract(
+        input_filepath, output_file_dir, mkvextract_exe_file_dir
+    )
+    if not output_attachment_filepath_list:
+        return tuple()
+    if not partial_attachment_filepath_dict:
+        skip_info_str: str = (
             f"extraction mkvextract attachment: "
-            f"extract {attachment_filename_list} "
-            f"from {input_filepath} unsuccessfully!"
-        )
-        print(error_str, file=sys.stderr)
-        raise subprocess.CalledProcessError(
-            returncode=return_code,
-            cmd=subprocess.list2cmdline(cmd_param_list),
-            output=stdout_text_str,
+            f"all attachments of {input_filepath} already existed, skip extraction."
         )
+        print(skip_info_str, file=sys.stderr)
+        g_logger.log(logging.INFO, skip_info_str)
+        return tuple(output_attachment_filepath_list)
+
+    attachment_filename_list: list = [
+        os.path.basename(filepath) for filepath in output_attachment_filepath_list
+    ]
+    _run_mkvextract_plan(
+        input_filepath,
+        ["attachments", *output_param_list],
+        partial_attachment_filepath_dict,
+        target_str=f"{attachment_filename_list} from {input_filepath}",
+        mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+        log_prefix="extraction mkvextract attachment",
+        quiet=quiet,
+    )
 
     return tuple(output_attachment_filepath_list)
 
 
+def _plan_chapter_mkvextract(
+    output_file_dir: str, output_file_name: str, chapter_format: str = "matroska"
+) -> tuple:
+    if chapter_format != "ogm":
+        chapter_format = "matroska"
+    output_filename_fullname: str = (
+        output_file_name + get_chapter_format_info_dict()[chapter_format]["ext"]
+    )
+    output_filepath: str = os.path.join(output_file_dir, output_filename_fullname)
+    valid_output_filepath: str = os.path.join(
+        output_file_dir, get_filename_with_valid_mark(output_filename_fullname)
+    )
+
+    if os.path.isfile(output_filepath):
+        os.remove(output_filepath)
+
+    if os.path.isfile(valid_output_filepath):
+        skip_info_str: str = (
+            f"extraction mkvextract menu: {valid_output_filepath} "
+            f"already existed, skip extraction."
+        )
+
+        print(skip_info_str, file=sys.stderr)
+        g_logger.log(logging.INFO, skip_info_str)
+        return valid_output_filepath, {}, []
+
+    partial_output_filepath: str = _get_partial_filepath(output_filepath)
+    output_param_list: list = ["chapters"]
+    if chapter_format == "ogm":
+        output_param_list.append("--simple")
+    output_param_list.append(partial_output_filepath)
+    return (
+        valid_output_filepath,
+        {partial_output_filepath: valid_output_filepath},
+        output_param_list,
+    )
+
+
 def extract_chapter(
     input_filepath: str,
     output_file_dir: str,
@@ -840,35 +1428,19 @@ def extract_chapter(
     chapter_format="matroska",
     mkvextract_exe_file_dir="",
 ) -> MenuTrackFile:
-    if not isinstance(input_filepath, str):
-        raise TypeError(
-            f"type of input_filepath must be str " f"instead of {type(input_filepath)}"
-        )
-
-    if not isinstance(output_file_dir, str):
-        raise TypeError(
-            f"type of output_file_dir must be str "
-            f"instead of {type(output_file_dir)}"
-        )
-
-    if not isinstance(output_file_name, str):
-        raise TypeError(
-            f"type of output_file_name must be str "
-            f"instead of {type(output_file_name)}"
-        )
-
-    if not isinstance(mkvextract_exe_file_dir, str):
-        raise TypeError(
-            f"type of mkvextract_exe_file_dir must be str "
-            f"instead of {type(mkvextract_exe_file_dir)}"
-        )
+    _check_str_param(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        output_file_name=output_file_name,
+        mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+    )
     if not os.path.isfile(input_filepath):
         raise FileNotFoundError(
             f"input Matroska file cannot be found with {input_filepath}"
         )
 
     all_format_info_dict: dict = get_chapter_format_info_dict()
-    if chapter_format not in all_format_info_dict.keys():
+    if chapter_format not in all_format_info_dict:
         raise RangeError(
             message=(
                 f"chapter_format must in {all_format_info_dict.keys()}, "
@@ -877,44 +1449,26 @@ def extract_chapter(
             valid_range=str(all_format_info_dict.keys()),
         )
 
-    mkvextract_exe_filename: str = "mkvextract.exe"
-    if mkvextract_exe_file_dir:
-        if not os.path.isdir(mkvextract_exe_file_dir):
-            raise DirNotFoundError(
-                f"ffmpeg dir cannot be found with {mkvextract_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(mkvextract_exe_file_dir)
-        if mkvextract_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in "
-                f"{mkvextract_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({mkvextract_exe_filename}):
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in " f"environment path"
-            )
-    if not os.path.isdir(output_file_dir):
-        os.makedirs(output_file_dir)
+    _resolve_exe("mkvextract.exe", mkvextract_exe_file_dir)
+    os.makedirs(output_file_dir, exist_ok=True)
 
-    media_info_list: list = MediaInfo.parse(input_filepath).to_data()["tracks"]
+    media_info_list: list = _get_media_info_list(input_filepath)
     menu_track_type: str = "Menu"
-    menu_info_list: list = [
-        track for track in media_info_list if track["track_type"] == menu_track_type
-    ]
-    if not menu_info_list:
+    menu_info_dict: dict = next(
+        (track for track in media_info_list if track["track_type"] == menu_track_type),
+        None,
+    )
+    if menu_info_dict is None:
         return
 
-    menu_info_dict: dict = menu_info_list[0]
-    time_re_exp: str = "(\\d{2})_(\\d{2})_(\\d{2})(\\d{3})"
     chapter_info_list: list = []
-    for key in menu_info_dict.keys():
-        re_result = re.search(time_re_exp, key)
+    for key in menu_info_dict:
+        re_result = g_chapter_time_re.search(key)
         if not re_result:
             continue
+        time_str: str = re_result.group(0)
         start_time: str = (
-            f"{re_result.group(1)}:{re_result.group(2)}:"
-            f"{re_result.group(3)}.{re_result.group(4)}"
+            f"{time_str[0:2]}:{time_str[3:5]}:{time_str[6:8]}.{time_str[8:11]}"
         )
         chapter_name: str = menu_info_dict[key]
         chapter_info_list.append(dict(start_time=start_time, chapter_name=chapter_name))
@@ -922,159 +1476,45 @@ def extract_chapter(
     if not chapter_info_list:
         return
 
-    matroska_suffix_set: str = {".mkv", ".mka", ".mks"}
-    matroska_bool: bool = any(
-        input_filepath.endswith(matroska_suffix)
-        for matroska_suffix in matroska_suffix_set
-    )
+    matroska_bool: bool = _is_matroska_filepath(input_filepath)
     if matroska_bool:
-        if chapter_format == "matroska" or chapter_format == "ogm":
-            chapter_extension = all_format_info_dict[chapter_format]["ext"]
-        else:
-            chapter_extension = all_format_info_dict["matroska"]["ext"]
-
-        output_filename_fullname: str = output_file_name + chapter_extension
-        output_filepath: str = os.path.join(output_file_dir, output_filename_fullname)
-
-        valid_output_filename_fullname: str = get_filename_with_valid_mark(
-            output_filename_fullname
-        )
-        valid_output_filepath: str = os.path.join(
-            output_file_dir, valid_output_filename_fullname
-        )
-
-        if os.path.isfile(output_filepath):
-            os.remove(output_filepath)
-
-        if os.path.isfile(valid_output_filepath):
-            skip_info_str: str = (
-                f"extraction mkvextract menu: {valid_output_filepath} "
-                f"already existed, skip extraction."
-            )
-
-            print(skip_info_str, file=sys.stderr)
-            g_logger.log(logging.INFO, skip_info_str)
-            output_filepath = valid_output_filepath
-        else:
-
-            mkvextract_exe_filepath: str = os.path.join(
-                mkvextract_exe_file_dir, mkvextract_exe_filename
-            )
-
-            menu_key: str = "chapters"
-            ogm_menu_key: str = "--simple"
-            menu_value: str = output_filepath
-
-            cmd_param_list: list = [
-                mkvextract_exe_filepath,
+        (
+            output_filepath,
+            partial_output_filepath_dict,
+            output_param_list,
+        ) = _plan_chapter_mkvextract(output_file_dir, output_file_name, chapter_format)
+        if output_param_list:
+            _run_mkvextract_plan(
                 input_filepath,
-                menu_key,
-                menu_value,
-            ]
-
-            if chapter_format == "ogm":
-                cmd_param_list.append(ogm_menu_key)
-
-            param_debug_str: str = (
-                f"extraction mkvextract menu: param: "
-                f"{subprocess.list2cmdline(cmd_param_list)}"
-            )
-            g_logger.log(logging.DEBUG, param_debug_str)
-
-            start_info_str: str = (
-                f"extraction menu: "
-                f"start extract {output_filename_fullname} "
-                f"from {input_filepath}"
-            )
-            print(start_info_str, file=sys.stderr)
-            g_logger.log(logging.INFO, start_info_str)
-
-            process = subprocess.Popen(
-                cmd_param_list,
-                stdout=subprocess.PIPE,
-                text=True,
-                encoding="utf-8",
-                errors="ignore",
+                output_param_list,
+                partial_output_filepath_dict,
+                target_str=f"{os.path.basename(output_filepath)} from {input_filepath}",
+                mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+                log_prefix="extraction mkvextract menu",
             )
-
-            stdout_lines: list = []
-            while process.poll() is None:
-                stdout_line = process.stdout.readline()
-                stdout_lines.append(stdout_line)
-                print(stdout_line, end="", file=sys.stderr)
-
-            return_code = process.returncode
-
-            if return_code == 0:
-                end_info_str: str = (
-                    f"extraction mkvextract menu: "
-                    f"extract {output_filename_fullname} "
-                    f"from {input_filepath} successfully."
-                )
-                print(end_info_str, file=sys.stderr)
-                g_logger.log(logging.INFO, end_info_str)
-            elif return_code == 1:
-                warning_prefix = "Warning:"
-                warning_text_str = "".join(
-                    line for line in stdout_lines if line.startswith(warning_prefix)
-                )
-                stdout_text_str = "".join(stdout_lines)
-                warning_str: str = (
-                    "extraction mkvextract attachment: "
-                    "mkvextract has output at least one warning, "
-                    "but extraction did continue.\n"
-                    f"warning:\n{warning_text_str}"
-                    f"stdout:\n{stdout_text_str}"
-                )
-                print(warning_str, file=sys.stderr)
-                g_logger.log(logging.WARNING, warning_str)
-            else:
-                error_str = (
-                    f"extraction mkvextract menu: "
-                    f"extract {output_filename_fullname} "
-                    f"from {input_filepath} unsuccessfully!"
-                )
-                print(error_str, file=sys.stderr)
-                raise subprocess.CalledProcessError(
-                    returncode=return_code,
-                    cmd=subprocess.list2cmdline(cmd_param_list),
-                    output=stdout_text_str,
-                )
-            os.rename(output_filepath, valid_output_filepath)
-            output_filepath = valid_output_filepath
     else:
         output_filename_fullname: str = output_file_name + all_format_info_dict[
             "matroska"
         ]["ext"]
         output_filepath: str = os.path.join(output_file_dir, output_filename_fullname)
-        chapter_info_list.sort(key=lambda element: element["start_time"])
-        chapters_xml = minidom.Document()
-
-        chapters_node = chapters_xml.createElement("Chapters")
-        chapters_xml.appendChild(chapters_node)
-        edition_entry_node = chapters_xml.createElement("EditionEntry")
-        chapters_node.appendChild(edition_entry_node)
+        chapter_info_list.sort(key=itemgetter("start_time"))
+        xml_part_list: list = [
+            '<?xml version="1.0" encoding="utf-8"?>\n<Chapters>\n  <EditionEntry>\n'
+        ]
         for chapter_info in chapter_info_list:
-            chapter_atom_node = chapters_xml.createElement("ChapterAtom")
-            edition_entry_node.appendChild(chapter_atom_node)
-
-            chapter_time_start_node = chapters_xml.createElement("ChapterTimeStart")
-            chapter_atom_node.appendChild(chapter_time_start_node)
-
-            text_node = chapters_xml.createTextNode(chapter_info["start_time"])
-            chapter_time_start_node.appendChild(text_node)
-
-            chapter_display_node = chapters_xml.createElement("ChapterDisplay")
-            chapter_atom_node.appendChild(chapter_display_node)
-
-            chapter_string_node = chapters_xml.createElement("ChapterString")
-            chapter_display_node.appendChild(chapter_string_node)
-
-            text_node = chapters_xml.createTextNode(chapter_info["chapter_name"])
-            chapter_string_node.appendChild(text_node)
-
-        with open(output_filepath, "w", encoding="utf-8-sig") as xml_file:
-            xml_file.write(chapters_xml.toprettyxml())
+            xml_part_list.append(
+                "    <ChapterAtom>\n"
+                f"      <ChapterTimeStart>{chapter_info['start_time']}"
+                "</ChapterTimeStart>\n"
+                "      <ChapterDisplay>\n"
+                f"        <ChapterString>{escape(chapter_info['chapter_name'])}"
+                "</ChapterString>\n"
+                "      </ChapterDisplay>\n"
+                "    </ChapterAtom>\n"
+            )
+        xml_part_list.append("  </EditionEntry>\n</Chapters>\n")
+        with open(output_filepath, "wb") as xml_file:
+            xml_file.write("".join(xml_part_list).encode("utf-8-sig"))
 
     original_chapter_filepath: str = ""
     if matroska_bool:
@@ -1105,215 +1545,240 @@ def extract_chapter(
     return MenuTrackFile(filepath=output_filepath)
 
 
-def extract_audio_track(
+def extract_all_from_mkv(
     input_filepath: str,
     output_file_dir: str,
     output_file_name: str,
-    audio_track: str,
     mkvextract_exe_file_dir="",
-    ffmpeg_exe_file_dir="",
-) -> list:
-    if not isinstance(input_filepath, str):
-        raise TypeError(
-            f"type of input_filepath must be str " f"instead of {type(input_filepath)}"
+    quiet: bool = False,
+) -> tuple:
+    _check_str_param(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        output_file_name=output_file_name,
+        mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+    )
+    if not os.path.isfile(input_filepath):
+        raise FileNotFoundError(
+            f"input Matroska file cannot be found with {input_filepath}"
         )
 
-    if not isinstance(output_file_dir, str):
+    if not _is_matroska_filepath(input_filepath):
         raise TypeError(
-            f"type of output_file_dir must be str "
-            f"instead of {type(output_file_dir)}"
+            f"format of input_filepath must be Matroska "
+            f"and it has to end with {set(g_matroska_suffix_frozenset)}"
         )
 
-    if not isinstance(output_file_name, str):
-        raise TypeError(
-            f"type of output_file_name must be str "
-            f"instead of {type(output_file_name)}"
-        )
+    os.makedirs(output_file_dir, exist_ok=True)
 
-    if not isinstance(audio_track, str):
-        raise TypeError(
-            f"type of audio_track must be str " f"instead of {type(audio_track)}"
-        )
+    mode_param_list: list = []
+    partial_output_filepath_dict: dict = {}
 
-    if not isinstance(mkvextract_exe_file_dir, str):
-        raise TypeError(
-            f"type of mkvextract_exe_file_dir must be str "
-            f"instead of {type(mkvextract_exe_file_dir)}"
+    index_text_info_dict: dict = {
+        get_stream_order(track["streamorder"]): track
+        for track in _get_media_info_list(input_filepath)
+        if track["track_type"].lower() == "text"
+    }
+    (
+        valid_text_filepath_dict,
+        partial_text_filepath_dict,
+        text_param_list,
+    ) = _plan_tracks_mkvextract(
+        input_filepath,
+        _get_mkv_subtitle_output_filepath_dict(
+            output_file_dir, output_file_name, index_text_info_dict
+        ),
+        mkvextract_exe_file_dir,
+    )
+    if text_param_list:
+        mode_param_list += ["tracks", *text_param_list]
+        partial_output_filepath_dict.update(partial_text_filepath_dict)
+
+    (
+        attachment_filepath_list,
+        partial_attachment_filepath_dict,
+        attachment_param_list,
+    ) = _plan_attachments_mkvextract(
+        input_filepath, output_file_dir, mkvextract_exe_file_dir
+    )
+    if attachment_param_list:
+        mode_param_list += ["attachments", *attachment_param_list]
+        partial_output_filepath_dict.update(partial_attachment_filepath_dict)
+
+    valid_chapter_filepath: str = ""
+    if _mkv_identify(input_filepath, mkvextract_exe_file_dir).get("chapters"):
+        (
+            valid_chapter_filepath,
+            partial_chapter_filepath_dict,
+            chapter_param_list,
+        ) = _plan_chapter_mkvextract(output_file_dir, output_file_name)
+        mode_param_list += chapter_param_list
+        partial_output_filepath_dict.update(partial_chapter_filepath_dict)
+
+    if mode_param_list:
+        _run_mkvextract_plan(
+            input_filepath,
+            mode_param_list,
+            partial_output_filepath_dict,
+            target_str=str(list(partial_output_filepath_dict.values())),
+            mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+            quiet=quiet,
         )
 
-    if not isinstance(ffmpeg_exe_file_dir, str):
-        raise TypeError(
-            f"type of ffmpeg_exe_file_dir must be str "
-            f"instead of {type(ffmpeg_exe_file_dir)}"
-        )
-    if not os.path.isfile(input_filepath):
-        raise FileNotFoundError(
-            f"input Matroska file cannot be found with {input_filepath}"
+    text_track_file_list: list = [
+        _get_text_track_file(
+            valid_text_filepath_dict[track_index], track_index, text_info_dict
         )
+        for track_index, text_info_dict in index_text_info_dict.items()
+    ]
+    menu_track_file: MenuTrackFile = (
+        MenuTrackFile(filepath=valid_chapter_filepath)
+        if valid_chapter_filepath
+        else None
+    )
+    return text_track_file_list, tuple(attachment_filepath_list), menu_track_file
 
-    available_track_type_set: set = {"default", "all"}
-    if audio_track not in available_track_type_set:
-        raise RangeError(
-            message=f"value of audio_track must in {available_track_type_set}",
-            valid_range=str(available_track_type_set),
-        )
 
-    mkvextract_exe_filename: str = "mkvextract.exe"
-    if mkvextract_exe_file_dir:
-        if not os.path.isdir(mkvextract_exe_file_dir):
-            raise DirNotFoundError(
-                f"ffmpeg dir cannot be found with {mkvextract_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(mkvextract_exe_file_dir)
-        if mkvextract_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in "
-                f"{mkvextract_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({mkvextract_exe_filename}):
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in " f"environment path"
-            )
+def _get_audio_track_file(
+    output_filepath: str, audio_info_dict: dict
+) -> AudioTrackFile:
+    delay_key: str = "delay"
 
-    ffmpeg_exe_filename: str = "ffmpeg.exe"
-    if ffmpeg_exe_file_dir:
-        if not os.path.isdir(ffmpeg_exe_file_dir):
-            raise DirNotFoundError(
-                f"ffmpeg dir cannot be found with {ffmpeg_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(ffmpeg_exe_file_dir)
-        if ffmpeg_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{ffmpeg_exe_filename} cannot be found in " f"{ffmpeg_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({ffmpeg_exe_filename}):
-            raise FileNotFoundError(
-                f"{ffmpeg_exe_filename} cannot be found in " f"environment path"
-            )
+    delay_ms: int = 0
+
+    if delay_key in audio_info_dict:
+        delay_ms = int(float(audio_info_dict[delay_key]))
 
-    media_info_list: list = MediaInfo.parse(input_filepath).to_data()["tracks"]
-    audio_info_dict: dict = next(
-        (track for track in media_info_list if track["track_type"] == "Audio"), None,
+    return AudioTrackFile(
+        filepath=output_filepath,
+        track_index=0,
+        track_format=audio_info_dict["format"].lower(),
+        duration_ms=int(float(audio_info_dict["duration"]))
+        if "duration" in audio_info_dict
+        else -1,
+        bit_rate_bps=-1,
+        bit_depth=(
+            -1
+            if isinstance(audio_info_dict["bit_depth"], str)
+            and audio_info_dict["bit_depth"].isdigit()
+            else int(audio_info_dict["bit_depth"])
+        )
+        if "bit_depth" in audio_info_dict
+        else -1,
+        delay_ms=delay_ms,
+        stream_size_byte=int(audio_info_dict["stream_size"])
+        if "stream_size" in audio_info_dict
+        else -1,
+        title=audio_info_dict.get("title", ""),
+        language=audio_info_dict.get("language", ""),
+        default_bool=g_yes_no_bool_dict.get(
+            audio_info_dict.get("default", "Yes"), False
+        ),
+        forced_bool=g_yes_no_bool_dict.get(audio_info_dict.get("forced", "Yes"), False),
     )
 
-    audio_track_cnt: int = 0
-    audio_track_file_list: list = []
-    for audio_info_dict in media_info_list:
-        if audio_info_dict["track_type"] != "Audio":
-            continue
-        audio_track_cnt += 1
 
-        audio_info_key_set: set = set(audio_info_dict.keys())
+def extract_audio_track(
+    input_filepath: str,
+    output_file_dir: str,
+    output_file_name: str,
+    audio_track: str,
+    mkvextract_exe_file_dir="",
+    ffmpeg_exe_file_dir="",
+) -> list:
+    _check_str_param(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        output_file_name=output_file_name,
+        audio_track=audio_track,
+        mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+        ffmpeg_exe_file_dir=ffmpeg_exe_file_dir,
+    )
+    if not os.path.isfile(input_filepath):
+        raise FileNotFoundError(
+            f"input Matroska file cannot be found with {input_filepath}"
+        )
+
+    if audio_track not in g_audio_track_frozenset:
+        raise RangeError(
+            message=f"value of audio_track must in {set(g_audio_track_frozenset)}",
+            valid_range=str(set(g_audio_track_frozenset)),
+        )
 
-        delay_key: str = "delay"
+    _resolve_exe("mkvextract.exe", mkvextract_exe_file_dir)
 
-        delay_ms: int = 0
+    _resolve_exe("ffmpeg.exe", ffmpeg_exe_file_dir)
 
-        if delay_key in audio_info_key_set:
-            delay_ms = int(float(audio_info_dict[delay_key]))
+    media_info_list: list = _get_media_info_list(input_filepath)
 
-        mkv_suffix_set: set = {".mkv", ".mka"}
-        _, extension = os.path.splitext(input_filepath)
-        mkv_bool: bool = extension in mkv_suffix_set
+    audio_info_list: list = [
+        track for track in media_info_list if track["track_type"] == "Audio"
+    ]
+    if audio_track == "default":
+        audio_info_list = audio_info_list[:1]
+    if not audio_info_list:
+        return []
 
-        audio_format: str = audio_info_dict["format"].lower()
+    os.makedirs(output_file_dir, exist_ok=True)
 
-        track_suffix: str = audio_format
-        if audio_format == "mpeg audio":
-            print(audio_info_dict)
-            if "format_profile" in audio_info_dict.keys():
-                format_profile = audio_info_dict["format_profile"].lower()
-                if format_profile == "layer 3":
-                    track_suffix = "mp3"
-                elif format_profile == "layer 2":
-                    track_suffix = "mp2"
-                else:
-                    raise RuntimeError(f"Unknown format_profile: {format_profile}")
-            else:
-                if audio_info_dict["codec_id_hint"].lower() == "mp3":
-                    track_suffix = "mp3"
-                else:
-                    raise RuntimeError(
-                        f"Unknown codec_id_hint: " f"{audio_info_dict['codec_id_hint']}"
-                    )
-        elif audio_format == "e-ac-3":
-            track_suffix = "ec3"
-        elif audio_format == "ac-3":
-            track_suffix = "ac3"
-        elif audio_format == "pcm":
-            track_suffix = "wav"
-        elif audio_format == "mlp fba":
-            track_suffix = "thd"
-        elif audio_format == "wma":
-            track_suffix = "wma"
-            mkv_bool = False
-
-        output_filepath: str = ""
-        if mkv_bool:
-            audio_index: int = int(audio_info_dict["streamorder"])
-            output_filepath = extract_track_mkvextract(
-                input_filepath,
+    audio_type: str = "audio"
+    mkv_bool: bool = _is_matroska_filepath(input_filepath)
+    mkv_track_output_filepath_dict: dict = {}
+    ffmpeg_track_output_filepath_dict: dict = {}
+    track_key_list: list = []
+    for audio_info_dict in audio_info_list:
+        track_suffix: str = _get_audio_track_suffix(audio_info_dict)
+        if mkv_bool and audio_info_dict["format"].lower() != "wma":
+            track_index: int = int(audio_info_dict["streamorder"])
+            mkv_track_output_filepath_dict[track_index] = os.path.join(
                 output_file_dir,
-                output_file_name,
-                track_suffix,
-                "audio",
-                audio_index,
-                mkvextract_exe_file_dir,
+                f"{output_file_name}_index_{track_index}.{track_suffix}",
             )
+            track_key_list.append((True, track_index))
         else:
-            output_filepath = extract_track_ffmpeg(
-                input_filepath=input_filepath,
-                output_file_dir=output_file_dir,
-                output_file_name=output_file_name,
-                output_file_suffix=track_suffix,
-                track_type="audio",
-                stream_identifier=int(audio_info_dict["stream_identifier"]),
-                ffmpeg_exe_file_dir=ffmpeg_exe_file_dir,
+            stream_identifier: int = int(audio_info_dict["stream_identifier"])
+            ffmpeg_track_output_filepath_dict[stream_identifier] = os.path.join(
+                output_file_dir,
+                f"{output_file_name}_{audio_type}_index_{stream_identifier}."
+                f"{track_suffix}",
             )
+            track_key_list.append((False, stream_identifier))
 
-        audio_track_file: AudioTrackFile = AudioTrackFile(
-            filepath=output_filepath,
-            track_index=0,
-            track_format=audio_info_dict["format"].lower(),
-            duration_ms=int(float(audio_info_dict["duration"]))
-            if "duration" in audio_info_dict.keys()
-            else -1,
-            bit_rate_bps=-1,
-            bit_depth=(
-                -1
-                if isinstance(audio_info_dict["bit_depth"], str)
-                and audio_info_dict["bit_depth"].isdigit()
-                else int(audio_info_dict["bit_depth"])
-            )
-            if "bit_depth" in audio_info_dict.keys()
-            else -1,
-            delay_ms=delay_ms,
-            stream_size_byte=int(audio_info_dict["stream_size"])
-            if "stream_size" in audio_info_dict.keys()
-            else -1,
-            title=audio_info_dict["title"] if "title" in audio_info_dict.keys() else "",
-            language=audio_info_dict["language"]
-            if "language" in audio_info_dict.keys()
-            else "",
-            default_bool=True
-            if "default" not in audio_info_dict.keys()
-            else (True if audio_info_dict["default"].lower() == "yes" else False),
-            forced_bool=True
-            if "forced" not in audio_info_dict.keys()
-            else (True if audio_info_dict["forced"].lower() == "yes" else False),
-        )
-        audio_track_file_list.append(audio_track_file)
-        if audio_track == "default" and audio_track_cnt == 1:
-            break
-
-    return audio_track_file_list
+    mkv_valid_output_filepath_dict: dict = (
+        _extract_tracks_mkvextract(
+            input_filepath=input_filepath,
+            track_output_filepath_dict=mkv_track_output_filepath_dict,
+            mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+        )
+        if mkv_track_output_filepath_dict
+        else {}
+    )
+    ffmpeg_valid_output_filepath_dict: dict = (
+        _extract_tracks_ffmpeg(
+            input_filepath=input_filepath,
+            track_type=audio_type,
+            track_output_filepath_dict=ffmpeg_track_output_filepath_dict,
+            ffmpeg_exe_file_dir=ffmpeg_exe_file_dir,
+        )
+        if ffmpeg_track_output_filepath_dict
+        else {}
+    )
+
+    return [
+        _get_audio_track_file(
+            mkv_valid_output_filepath_dict[track_key]
+            if mkv_track_bool
+            else ffmpeg_valid_output_filepath_dict[track_key],
+            audio_info_dict,
+        )
+        for (mkv_track_bool, track_key), audio_info_dict in zip(
+            track_key_list, audio_info_list
+        )
+    ]
 
 
 def get_video_with_valid_metadata(filepath: str, output_dir: str, output_name: str):
-    media_info_data: dict = MediaInfo.parse(filepath).to_data()
-    media_info_list: list = media_info_data["tracks"]
+    media_info_list: list = _get_media_info_list(filepath)
     video_info_dict: dict = next(
         (track for track in media_info_list if track["track_type"] == "Video"), None,
     )
@@ -1325,7 +1790,8 @@ def get_video_with_valid_metadata(filepath: str, output_dir: str, output_name: s
     cache_mkv_full_filename: str = cache_mkv_filename + ".mkv"
     cache_mkv_filepath: str = os.path.join(output_dir, cache_mkv_full_filename)
     unreliable_meta_data_bool: bool = not reliable_meta_data(
-        input_filename=full_filename, media_info_data=media_info_data
+        input_filename=full_filename,
+        media_info_data={"tracks": media_info_list},
     )
     if unreliable_meta_data_bool:
         if not os.path.isfile(cache_mkv_filepath):
@@ -1334,7 +1800,7 @@ def get_video_with_valid_metadata(filepath: str, output_dir: str, output_name: s
                     dict(
                         filepath=filepath,
                         track_id=int(video_info_dict["streamorder"])
-                        if "streamorder" in video_info_dict.keys()
+                        if "streamorder" in video_info_dict
                         and video_info_dict["streamorder"].isdigit()
                         else 0,
                     )
@@ -1347,6 +1813,12 @@ def get_video_with_valid_metadata(filepath: str, output_dir: str, output_name: s
     return filepath
 
 
+def _get_hdr_field_tuple(hdr_info_dict: dict) -> tuple:
+    if not hdr_info_dict:
+        return g_default_hdr_field_tuple
+    return g_hdr_field_getter(hdr_info_dict)
+
+
 def get_fr_and_original_fr(video_info_dict: dict):
     frame_rate: str = get_proper_frame_rate(
         video_info_dict=video_info_dict, original_fps=False
@@ -1364,73 +1836,21 @@ def extract_video_track(
     mkvextract_exe_file_dir="",
     ffmpeg_exe_file_dir="",
 ) -> VideoTrackFile:
-    if not isinstance(input_filepath, str):
-        raise TypeError(
-            f"type of input_filepath must be str " f"instead of {type(input_filepath)}"
-        )
-
-    if not isinstance(output_file_dir, str):
-        raise TypeError(
-            f"type of output_file_dir must be str "
-            f"instead of {type(output_file_dir)}"
-        )
-
-    if not isinstance(output_file_name, str):
-        raise TypeError(
-            f"type of output_file_name must be str "
-            f"instead of {type(output_file_name)}"
-        )
-
-    if not isinstance(mkvextract_exe_file_dir, str):
-        raise TypeError(
-            f"type of mkvextract_exe_file_dir must be str "
-            f"instead of {type(mkvextract_exe_file_dir)}"
-        )
-
-    if not isinstance(ffmpeg_exe_file_dir, str):
-        raise TypeError(
-            f"type of ffmpeg_exe_file_dir must be str "
-            f"instead of {type(ffmpeg_exe_file_dir)}"
-        )
+    _check_str_param(
+        input_filepath=input_filepath,
+        output_file_dir=output_file_dir,
+        output_file_name=output_file_name,
+        mkvextract_exe_file_dir=mkvextract_exe_file_dir,
+        ffmpeg_exe_file_dir=ffmpeg_exe_file_dir,
+    )
     if not os.path.isfile(input_filepath):
         raise FileNotFoundError(
             f"input Matroska file cannot be found with {input_filepath}"
         )
 
-    mkvextract_exe_filename: str = "mkvextract.exe"
-    if mkvextract_exe_file_dir:
-        if not os.path.isdir(mkvextract_exe_file_dir):
-            raise DirNotFoundError(
-                f"ffmpeg dir cannot be found with {mkvextract_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(mkvextract_exe_file_dir)
-        if mkvextract_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in "
-                f"{mkvextract_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({mkvextract_exe_filename}):
-            raise FileNotFoundError(
-                f"{mkvextract_exe_filename} cannot be found in " f"environment path"
-            )
+    _resolve_exe("mkvextract.exe", mkvextract_exe_file_dir)
 
-    ffmpeg_exe_filename: str = "ffmpeg.exe"
-    if ffmpeg_exe_file_dir:
-        if not os.path.isdir(ffmpeg_exe_file_dir):
-            raise DirNotFoundError(
-                f"ffmpeg dir cannot be found with {ffmpeg_exe_file_dir}"
-            )
-        all_filename_list: list = os.listdir(ffmpeg_exe_file_dir)
-        if ffmpeg_exe_filename not in all_filename_list:
-            raise FileNotFoundError(
-                f"{ffmpeg_exe_filename} cannot be found in " f"{ffmpeg_exe_file_dir}"
-            )
-    else:
-        if not check_file_environ_path({ffmpeg_exe_filename}):
-            raise FileNotFoundError(
-                f"{ffmpeg_exe_filename} cannot be found in " f"environment path"
-            )
+    _resolve_exe("ffmpeg.exe", ffmpeg_exe_file_dir)
 
     valid_video_filepath: str = get_video_with_valid_metadata(
         filepath=input_filepath,
@@ -1438,7 +1858,7 @@ def extract_video_track(
         output_name=output_file_name,
     )
 
-    media_info_list: list = MediaInfo.parse(valid_video_filepath).to_data()["tracks"]
+    media_info_list: list = _get_media_info_list(valid_video_filepath)
     video_info_dict: dict = next(
         (track for track in media_info_list if track["track_type"] == "Video"), None,
     )
@@ -1448,34 +1868,18 @@ def extract_video_track(
 
     hdr_info_dict: dict = get_proper_hdr_info(video_info_dict)
 
-    mkv_suffix: str = ".mkv"
-    mp4_suffix: str = ".mp4"
-    m4v_suffix: str = ".m4v"
-    flv_suffix: str = ".flv"
-    mkv_bool: bool = input_filepath.endswith(mkv_suffix)
-    mp4_bool: bool = input_filepath.endswith(mp4_suffix)
-    m4v_bool: bool = input_filepath.endswith(m4v_suffix)
-    flv_bool: bool = input_filepath.endswith(flv_suffix)
+    input_extension: str = os.path.splitext(input_filepath)[1].lower()
+    mkv_bool: bool = input_extension == ".mkv"
 
     video_format: str = video_info_dict["format"].lower()
 
-    if video_format == "hevc":
-        track_suffix: str = "265"
-    elif video_format == "avc":
-        track_suffix: str = "264"
-    elif video_format == "mpeg-4 visual":
-        track_suffix: str = "263"
-    elif video_format == "mpeg video":
-        track_suffix: str = "mpeg"
-    else:
+    if video_format not in g_video_format_suffix_dict:
         raise RuntimeError(f"unknown video format:{video_format}")
+    track_suffix: str = g_video_format_suffix_dict[video_format]
 
-    if mp4_bool:
-        track_suffix = mp4_suffix
-    elif flv_bool:
-        track_suffix = flv_suffix
-    elif m4v_bool:
-        track_suffix = mp4_suffix
+    track_suffix = g_video_container_track_suffix_dict.get(
+        input_extension, track_suffix
+    )
 
     output_filepath: str = ""
     video_index: int = int(video_info_dict["streamorder"])
@@ -1500,13 +1904,20 @@ def extract_video_track(
             ffmpeg_exe_file_dir=ffmpeg_exe_file_dir,
         )
 
+    (
+        mastering_display_color_primaries,
+        min_mastering_display_luminance,
+        max_mastering_display_luminance,
+        max_content_light_level,
+        max_frameaverage_light_level,
+    ) = _get_hdr_field_tuple(hdr_info_dict)
     video_track_file: VideoTrackFile = VideoTrackFile(
         filepath=output_filepath,
         track_index=0,
         track_format=video_info_dict["format"].lower(),
         duration_ms=int(float(video_info_dict["duration"])),
         bit_rate_bps=int(video_info_dict["bit_rate"])
-        if "bit_rate" in video_info_dict.keys()
+        if "bit_rate" in video_info_dict
         else -1,
         width=video_info_dict["width"],
         height=video_info_dict["height"],
@@ -1515,57 +1926,35 @@ def extract_video_track(
         original_frame_rate=frame_rate_info_dict["original_frame_rate"],
         frame_count=int(video_info_dict["frame_count"]),
         color_range=video_info_dict["color_range"].lower()
-        if "color_range" in video_info_dict.keys()
+        if "color_range" in video_info_dict
         else "limited",
-        color_space=video_info_dict["color_space"]
-        if "color_space" in video_info_dict.keys()
-        else "",
+        color_space=video_info_dict.get("color_space", ""),
         color_matrix=color_specification_dict["color_matrix"],
         color_primaries=color_specification_dict["color_primaries"],
         transfer=color_specification_dict["transfer"],
-        chroma_subsampling=video_info_dict["chroma_subsampling"]
-        if "chroma_subsampling" in video_info_dict.keys()
-        else "",
+        chroma_subsampling=video_info_dict.get("chroma_subsampling", ""),
         bit_depth=int(video_info_dict["bit_depth"])
-        if "bit_depth" in video_info_dict.keys()
+        if "bit_depth" in video_info_dict
         else -1,
-        sample_aspect_ratio=video_info_dict["pixel_aspect_ratio"]
-        if "pixel_aspect_ratio" in video_info_dict.keys()
-        else 1,
+        sample_aspect_ratio=video_info_dict.get("pixel_aspect_ratio", 1),
         delay_ms=int(float(video_info_dict["delay"]))
-        if "delay" in video_info_dict.keys()
+        if "delay" in video_info_dict
         else 0,
         stream_size_byte=int(video_info_dict["stream_size"])
-        if "stream_size" in video_info_dict.keys()
-        else -1,
-        title=video_info_dict["title"] if "title" in video_info_dict.keys() else "",
-        language=video_info_dict["language"]
-        if "language" in video_info_dict.keys()
-        else "",
-        default_bool=True
-        if "default" not in video_info_dict.keys()
-        else (True if video_info_dict["default"].lower() == "yes" else False),
-        forced_bool=True
-        if "forced" not in video_info_dict.keys()
-        else (True if video_info_dict["forced"].lower() == "yes" else False),
-        hdr_bool=hdr_info_dict != dict(),
-        mastering_display_color_primaries=hdr_info_dict[
-            "mastering_display_color_primaries"
-        ]
-        if hdr_info_dict
-        else "",
-        min_mastering_display_luminance=hdr_info_dict["min_mastering_display_luminance"]
-        if hdr_info_dict
-        else -1,
-        max_mastering_display_luminance=hdr_info_dict["max_mastering_display_luminance"]
-        if hdr_info_dict
-        else -1,
-        max_content_light_level=hdr_info_dict["max_content_light_level"]
-        if hdr_info_dict
-        else -1,
-        max_frameaverage_light_level=hdr_info_dict["max_frameaverage_light_level"]
-        if hdr_info_dict
+        if "stream_size" in video_info_dict
         else -1,
+        title=video_info_dict.get("title", ""),
+        language=video_info_dict.get("language", ""),
+        default_bool=g_yes_no_bool_dict.get(
+            video_info_dict.get("default", "Yes"), False
+        ),
+        forced_bool=g_yes_no_bool_dict.get(video_info_dict.get("forced", "Yes"), False),
+        hdr_bool=bool(hdr_info_dict),
+        mastering_display_color_primaries=mastering_display_color_primaries,
+        min_mastering_display_luminance=min_mastering_display_luminance,
+        max_mastering_display_luminance=max_mastering_display_luminance,
+        max_content_light_level=max_content_light_level,
+        max_frameaverage_light_level=max_frameaverage_light_level,
     )
 
     if valid_video_filepath != input_filepath:
@@ -1583,23 +1972,13 @@ def copy_video(
     output_file_name: str,
     using_original_if_possible=False,
 ) -> VideoTrackFile:
-    if not isinstance(input_filepath, str):
-        raise TypeError(
-            f"type of input_filepath must be str " f"instead of {type(input_filepath)}"
-        )
-
-    if not isinstance(output_file_dir, str):
-        raise TypeError(
-            f"type of output_file_dir must be str "
-            f"instead of {type(output_file_dir)}"
-        )
+    _check_str_param(input_filepath=input_filepath, output_file_dir=output_file_dir)
     if not os.path.isfile(input_filepath):
         raise FileNotFoundError(
             f"input Matroska file cannot be found with {input_filepath}"
         )
 
-    if not os.path.isdir(output_file_dir):
-        os.makedirs(output_file_dir)
+    os.makedirs(output_file_dir, exist_ok=True)
 
     constant = global_constant()
 
@@ -1609,7 +1988,7 @@ def copy_video(
         output_name=output_file_name,
     )
 
-    media_info_list: list = MediaInfo.parse(valid_video_filepath).to_data()["tracks"]
+    media_info_list: list = _get_media_info_list(valid_video_filepath)
     video_info_dict: dict = next(
         (track for track in media_info_list if track["track_type"] == "Video"), None,
     )
@@ -1661,72 +2040,57 @@ def copy_video(
     else:
         output_filepath: str = valid_video_filepath
 
+    (
+        mastering_display_color_primaries,
+        min_mastering_display_luminance,
+        max_mastering_display_luminance,
+        max_content_light_level,
+        max_frameaverage_light_level,
+    ) = _get_hdr_field_tuple(hdr_info_dict)
     video_track_file: VideoTrackFile = VideoTrackFile(
         filepath=output_filepath,
         track_index=get_stream_order(video_info_dict["streamorder"]),
         track_format=video_info_dict["format"].lower(),
         duration_ms=int(float(video_info_dict["duration"])),
         bit_rate_bps=int(video_info_dict["bit_rate"])
-        if "bit_rate" in video_info_dict.keys()
+        if "bit_rate" in video_info_dict
         else -1,
         width=video_info_dict["width"],
         height=video_info_dict["height"],
         frame_rate_mode=video_info_dict["frame_rate_mode"].lower()
-        if "frame_rate_mode" in video_info_dict.keys()
+        if "frame_rate_mode" in video_info_dict
         else "cfr",
         frame_rate=frame_rate_info_dict["frame_rate"],
         original_frame_rate=frame_rate_info_dict["original_frame_rate"],
         frame_count=int(video_info_dict["frame_count"]),
         color_range=video_info_dict["color_range"].lower()
-        if "color_range" in video_info_dict.keys()
+        if "color_range" in video_info_dict
         else "limited",
-        color_space=video_info_dict["color_space"]
-        if "color_space" in video_info_dict.keys()
-        else "",
+        color_space=video_info_dict.get("color_space", ""),
         color_matrix=color_specification_dict["color_matrix"],
         color_primaries=color_specification_dict["color_primaries"],
         transfer=color_specification_dict["transfer"],
-        chroma_subsampling=video_info_dict["chroma_subsampling"]
-        if "chroma_subsampling" in video_info_dict.keys()
-        else "",
+        chroma_subsampling=video_info_dict.get("chroma_subsampling", ""),
         bit_depth=int(video_info_dict["bit_depth"])
-        if "bit_depth" in video_info_dict.keys()
+        if "bit_depth" in video_info_dict
         else -1,
-        sample_aspect_ratio=video_info_dict["pixel_aspect_ratio"]
-        if "pixel_aspect_ratio" in video_info_dict.keys()
-        else 1,
+        sample_aspect_ratio=video_info_dict.get("pixel_aspect_ratio", 1),
         delay_ms=0,
         stream_size_byte=int(video_info_dict["stream_size"])
-        if "stream_size" in video_info_dict.keys()
-        else -1,
-        title=video_info_dict["title"] if "title" in video_info_dict.keys() else "",
-        language=video_info_dict["language"]
-        if "language" in video_info_dict.keys()
-        else "",
-        default_bool=True
-        if "default" not in video_info_dict.keys()
-        else (True if video_info_dict["default"].lower() == "yes" else False),
-        forced_bool=True
-        if "forced" not in video_info_dict.keys()
-        else (True if video_info_dict["forced"].lower() == "yes" else False),
-        hdr_bool=hdr_info_dict != dict(),
-        mastering_display_color_primaries=hdr_info_dict[
-            "mastering_display_color_primaries"
-        ]
-        if hdr_info_dict
-        else "",
-        min_mastering_display_luminance=hdr_info_dict["min_mastering_display_luminance"]
-        if hdr_info_dict
-        else -1,
-        max_mastering_display_luminance=hdr_info_dict["max_mastering_display_luminance"]
-        if hdr_info_dict
-        else -1,
-        max_content_light_level=hdr_info_dict["max_content_light_level"]
-        if hdr_info_dict
-        else -1,
-        max_frameaverage_light_level=hdr_info_dict["max_frameaverage_light_level"]
-        if hdr_info_dict
+        if "stream_size" in video_info_dict
         else -1,
+        title=video_info_dict.get("title", ""),
+        language=video_info_dict.get("language", ""),
+        default_bool=g_yes_no_bool_dict.get(
+            video_info_dict.get("default", "Yes"), False
+        ),
+        forced_bool=g_yes_no_bool_dict.get(video_info_dict.get("forced", "Yes"), False),
+        hdr_bool=bool(hdr_info_dict),
+        mastering_display_color_primaries=mastering_display_color_primaries,
+        min_mastering_display_luminance=min_mastering_display_luminance,
+        max_mastering_display_luminance=max_mastering_display_luminance,
+        max_content_light_level=max_content_light_level,
+        max_frameaverage_light_level=max_frameaverage_light_level,
     )
 
     return video_track_file
@@ -1739,8 +2103,7 @@ def extract_series_subtitles(
     subtitle_stream_identifier: int = 0,
     language_suffix: str = "",
 ):
-    if not os.path.isdir(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
     video_filename_list: list = [
         filename
@@ -1748,11 +2111,13 @@ def extract_series_subtitles(
         if re.search(video_filename_re_exp, filename)
     ]
 
-    for full_filename in video_filename_list:
-        filepath: str = os.path.join(video_dir, full_filename)
+    video_filepath_list: list = [
+        os.path.join(video_dir, full_filename) for full_filename in video_filename_list
+    ]
+    for filepath, media_info_list in _iter_media_info_prefetched(video_filepath_list):
+        full_filename: str = os.path.basename(filepath)
         filename, extension = os.path.splitext(full_filename)
 
-        media_info_list: list = MediaInfo.parse(filepath).to_data()["tracks"]
         text_info_dict: dict = next(
             (
                 track
@@ -1763,19 +2128,9 @@ def extract_series_subtitles(
             None,
         )
 
-        text_format: str = text_info_dict["format"].lower()
-        track_suffix: str = text_format
-        if text_format == "pgs":
-            track_suffix = "sup"
-        elif text_format == "vobsub":
-            track_suffix = "idx"
-        elif text_format == "utf-8":
-            track_suffix = "srt"
-
-        constant = global_constant()
-        mkv_suffix_set: set = set(constant.matroska_extensions)
+        track_suffix: str = _get_subtitle_track_suffix(text_info_dict)
 
-        if any(filepath.endswith(mkv_suffix) for mkv_suffix in mkv_suffix_set):
+        if _is_matroska_filepath(filepath):
             output_filename: str = filename + language_suffix
 
             output_filepath: str = extract_track_mkvextract(
@@ -1804,8 +2159,7 @@ def extract_series_audios(
     output_dir: str,
     audio_stream_identifier: int = 0,
 ):
-    if not os.path.isdir(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
     video_filename_list: list = [
         filename
@@ -1813,71 +2167,65 @@ def extract_series_audios(
         if re.search(video_filename_re_exp, filename)
     ]
 
-    for full_filename in video_filename_list:
-        filepath: str = os.path.join(video_dir, full_filename)
-        filename, extension = os.path.splitext(full_filename)
-
-        media_info_list: list = MediaInfo.parse(filepath).to_data()["tracks"]
-        audio_info_dict: dict = next(
-            (
-                track
-                for track in media_info_list
-                if track["track_type"] == "Audio"
-                and track["stream_identifier"] == audio_stream_identifier
-            ),
-            None,
-        )
-
-        mkv_suffix_set: set = {".mkv", ".mka"}
-        _, extension = os.path.splitext(filepath)
-        mkv_bool: bool = extension in mkv_suffix_set
-
-        audio_format: str = audio_info_dict["format"].lower()
+    video_filepath_list: list = [
+        os.path.join(video_dir, full_filename) for full_filename in video_filename_list
+    ]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=g_extraction_max_workers, thread_name_prefix="extraction"
+    ) as executor:
+        extraction_future_list: list = []
+        try:
+            for filepath, media_info_list in _iter_media_info_prefetched(
+                video_filepath_list
+            ):
+                filename: str = os.path.splitext(os.path.basename(filepath))[0]
+
+                audio_info_dict: dict = next(
+                    (
+                        track
+                        for track in media_info_list
+                        if track["track_type"] == "Audio"
+                        and track["stream_identifier"] == audio_stream_identifier
+                    ),
+                    None,
+                )
 
-        track_suffix: str = audio_format
-        if audio_format == "mpeg audio":
-            print(audio_info_dict)
-            if "format_profile" in audio_info_dict.keys():
-                format_profile = audio_info_dict["format_profile"].lower()
-                if format_profile == "layer 3":
-                    track_suffix = "mp3"
-                elif format_profile == "layer 2":
-                    track_suffix = "mp2"
-                else:
-                    raise RuntimeError(f"Unknown format_profile: {format_profile}")
-            else:
-                if audio_info_dict["codec_id_hint"].lower() == "mp3":
-                    track_suffix = "mp3"
+                mkv_bool: bool = _is_matroska_filepath(filepath)
+
+                track_suffix: str = _get_audio_track_suffix(audio_info_dict)
+                if audio_info_dict["format"].lower() == "wma":
+                    mkv_bool = False
+
+                if mkv_bool:
+                    extraction_future_list.append(
+                        executor.submit(
+                            extract_track_mkvextract,
+                            filepath,
+                            output_dir,
+                            filename,
+                            track_suffix,
+                            "audio",
+                            int(audio_info_dict["streamorder"]),
+                            quiet=True,
+                        )
+                    )
                 else:
-                    raise RuntimeError(
-                        f"Unknown codec_id_hint: " f"{audio_info_dict['codec_id_hint']}"
+                    extraction_future_list.append(
+                        extract_track_ffmpeg_async(
+                            input_filepath=filepath,
+                            output_file_dir=output_dir,
+                            output_file_name=filename,
+                            output_file_suffix=track_suffix,
+                            track_type="audio",
+                            stream_identifier=int(
+                                audio_info_dict["stream_identifier"]
+                            ),
+                            executor=executor,
+                        )
                     )
-        elif audio_format == "e-ac-3":
-            track_suffix = "ec3"
-        elif audio_format == "ac-3":
-            track_suffix = "ac3"
-        elif audio_format == "pcm":
-            track_suffix = "wav"
-        elif audio_format == "mlp fba":
-            track_suffix = "thd"
-        elif audio_format == "wma":
-            track_suffix = "wma"
-            mkv_bool = False
-
-        output_filepath: str = ""
-        if mkv_bool:
-            audio_index: int = int(audio_info_dict["streamorder"])
-            output_filepath = extract_track_mkvextract(
-                filepath, output_dir, filename, track_suffix, "audio", audio_index,
-            )
-        else:
-            output_filepath = extract_track_ffmpeg(
-                input_filepath=filepath,
-                output_file_dir=output_dir,
-                output_file_name=filename,
-                output_file_suffix=track_suffix,
-                track_type="audio",
-                stream_identifier=int(audio_info_dict["stream_identifier"]),
-            )
-
+        except BaseException:
+            for extraction_future in extraction_future_list:
+                extraction_future.cancel()
+            raise
 
+        _wait_futures_first_exception(extraction_future_list)
@@ -19,6 +19,7 @@
 import os
 import subprocess
 import json
+import functools
 import logging
 import sys
 
@@ -27,7 +28,10 @@ g_logger.propagate = True
 g_logger.setLevel(logging.DEBUG)
 
 
-def ffmpeg_probe(filepath: str, ffprobe_exe_file_dir=""):
+@functools.lru_cache(maxsize=256)
+def _run_ffprobe(
+    filepath: str, mtime_ns: int, size_byte: int, ffprobe_exe_file_dir: str
+) -> bytes:
     ffprobe_exe_filename = "ffprobe.exe"
     ffprobe_exe_filepath = os.path.join(
         ffprobe_exe_file_dir, ffprobe_exe_filename
@@ -65,6 +69,17 @@ def ffmpeg_probe(filepath: str, ffprobe_exe_file_dir=""):
         print(error_info_str, file=sys.stderr)
         raise ChildProcessError(error_info_str)
 
+    return stdout_data
+
+
+def ffmpeg_probe(filepath: str, ffprobe_exe_file_dir=""):
+    file_stat = os.stat(filepath)
+    stdout_data: bytes = _run_ffprobe(
+        os.path.abspath(filepath),
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        ffprobe_exe_file_dir,
+    )
     return json.loads(stdout_data.decode("utf-8"))
 
 
@@ -19,7 +19,7 @@
 import string
 import os
 from .name_hash import hash_name
-from .constant import global_constant
+from .constant import VALID_FILE_SUFFIX
 
 
 def is_ascii(s) -> str:
@@ -52,8 +52,7 @@ def get_unique_printable_filename(filepath: str) -> str:
 
 def is_filename_with_valid_mark(full_filename: str) -> bool:
     filename, extension = os.path.splitext(full_filename)
-    constant = global_constant()
-    valid_file_suffix: str = constant.valid_file_suffix
+    valid_file_suffix: str = VALID_FILE_SUFFIX
     if filename.endswith(valid_file_suffix):
         return True
     else:
@@ -62,8 +61,7 @@ def is_filename_with_valid_mark(full_filename: str) -> bool:
 
 def get_filename_with_valid_mark(full_filename: str) -> str:
     filename, extension = os.path.splitext(full_filename)
-    constant = global_constant()
-    output_full_filename: str = filename + constant.valid_file_suffix + extension
+    output_full_filename: str = filename + VALID_FILE_SUFFIX + extension
     return output_full_filename
 
 
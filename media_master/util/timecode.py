@@ -16,36 +16,38 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
 import re
+import shutil
 
 
 def mkv_timecode_2_standard_timecode(mkv_timecode_filepath: str):
     mkv_timecode_comment_re_exp: str = "^# timestamp format v(?P<version_num>\\d+)"
     standard_timecode_comment_format: str = "# timecode format v{version_num}"
 
-    data_str: str = ""
-    with open(file=mkv_timecode_filepath, mode="r") as file:
-        data_str = file.read()
+    standard_timecode_filepath: str = mkv_timecode_filepath
+    cache_timecode_filepath: str = standard_timecode_filepath + ".tmp"
 
-    re_result = re.search(pattern=mkv_timecode_comment_re_exp, string=data_str)
+    with open(file=mkv_timecode_filepath, mode="r") as file:
+        first_line_str: str = file.readline()
+        re_result = re.search(
+            pattern=mkv_timecode_comment_re_exp, string=first_line_str
+        )
 
-    if not re_result:
-        return mkv_timecode_filepath
+        if not re_result:
+            return mkv_timecode_filepath
 
-    mkv_timecode_comment: str = re_result.group(0)
-    version_num: str = re_result.groupdict()["version_num"]
-    standard_timecode_comment: str = standard_timecode_comment_format.format(
-        version_num=version_num
-    )
-    data_str = data_str.replace(
-        mkv_timecode_comment, standard_timecode_comment
-    )
+        version_num: str = re_result.groupdict()["version_num"]
+        standard_timecode_comment: str = standard_timecode_comment_format.format(
+            version_num=version_num
+        )
 
-    standard_timecode_filepath: str = mkv_timecode_filepath
+        with open(file=cache_timecode_filepath, mode="w") as cache_file:
+            cache_file.write(
+                standard_timecode_comment + first_line_str[re_result.end() :]
+            )
+            shutil.copyfileobj(file, cache_file, 1 << 16)
 
-    with open(file=standard_timecode_filepath, mode="w") as file:
-        file.write(data_str)
+    os.replace(cache_timecode_filepath, standard_timecode_filepath)
 
     return standard_timecode_filepath
-
-
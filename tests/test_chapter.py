@@ -0,0 +1,145 @@
+import os
+import shutil
+import sys
+import types
+
+import pytest
+
+from media_master.util import chapter
+
+CHAPTER_LIST = [(0, "Opening"), (90500, "Part A"), (1325123, "エンディング")]
+
+SOURCE_CHAPTER_TEXT_DICT = dict(
+    simple=(
+        ".txt",
+        "00:00:00.000,Opening\n"
+        "00:01:30.500,Part A\n"
+        "00:22:05.123,エンディング\n",
+    ),
+    tab=(
+        ".txt",
+        "00:00:00.000\tOpening\n"
+        "00:01:30.500\tPart A\n"
+        "00:22:05.123\tエンディング\n",
+    ),
+    ogm=(
+        ".txt",
+        "CHAPTER01=00:00:00.000\n"
+        "CHAPTER01NAME=Opening\n"
+        "CHAPTER02=00:01:30.500\n"
+        "CHAPTER02NAME=Part A\n"
+        "CHAPTER03=00:22:05.123\n"
+        "CHAPTER03NAME=エンディング\n",
+    ),
+    pot=(
+        ".pbf",
+        "[Bookmark]\n"
+        "0=0*Opening*\n"
+        "1=90500*Part A*\n"
+        "2=1325123*エンディング*\n",
+    ),
+    matroska=(
+        ".xml",
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        "<Chapters><EditionEntry>"
+        "<ChapterAtom><ChapterTimeStart>00:00:00.000</ChapterTimeStart>"
+        "<ChapterDisplay><ChapterString>Opening</ChapterString></ChapterDisplay>"
+        "</ChapterAtom>"
+        "<ChapterAtom><ChapterTimeStart>00:01:30.500000000</ChapterTimeStart>"
+        "<ChapterDisplay><ChapterString>Part A</ChapterString></ChapterDisplay>"
+        "</ChapterAtom>"
+        "<ChapterAtom><ChapterTimeStart>00:22:05.123000000</ChapterTimeStart>"
+        "<ChapterDisplay><ChapterString>エンディング</ChapterString>"
+        "</ChapterDisplay>"
+        "</ChapterAtom>"
+        "</EditionEntry></Chapters>\n",
+    ),
+)
+
+
+def _write_source_chapter(output_dir: str, src_chapter_format: str) -> str:
+    extension, text_str = SOURCE_CHAPTER_TEXT_DICT[src_chapter_format]
+    src_filepath = os.path.join(output_dir, f"src_{src_chapter_format}{extension}")
+    with open(src_filepath, "w", encoding="utf-8-sig") as file:
+        file.write(text_str)
+    return src_filepath
+
+
+def _read_chapter_list(filepath: str) -> list:
+    if filepath.lower().endswith(".xml"):
+        return chapter._parse_matroska_chapter(filepath)
+    return chapter._parse_text_chapter(filepath)
+
+
+def _run_legacy_converter(
+    monkeypatch, src_filepath: str, dst_filepath: str, dst_chapter_format: str
+):
+    monkeypatch.setitem(
+        sys.modules, "win32clipboard", types.ModuleType("win32clipboard")
+    )
+    from media_master.util import chapter_converter
+
+    format_info: dict = chapter.get_chapter_format_info_dict()[dst_chapter_format]
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "chapter_converter.py",
+            "--format",
+            format_info["cmd_format"],
+            "--output",
+            dst_filepath,
+            src_filepath,
+        ],
+    )
+    chapter_converter.main()
+
+
+@pytest.mark.parametrize("dst_chapter_format", list(SOURCE_CHAPTER_TEXT_DICT))
+@pytest.mark.parametrize("src_chapter_format", list(SOURCE_CHAPTER_TEXT_DICT))
+def test_convert_chapter_format_matches_legacy_converter(
+    tmp_path, monkeypatch, src_chapter_format, dst_chapter_format
+):
+    monkeypatch.delenv("MM_USE_LEGACY_CHAPTER_CONVERTER", raising=False)
+    monkeypatch.chdir(tmp_path)
+    src_filepath = _write_source_chapter(str(tmp_path), src_chapter_format)
+
+    dst_filepath = chapter.convert_chapter_format(
+        src_filepath,
+        os.path.join(str(tmp_path), "new"),
+        "chapter",
+        dst_chapter_format,
+    )
+    chapter_list = _read_chapter_list(dst_filepath)
+    assert chapter_list == CHAPTER_LIST
+
+    if "matroska" in (src_chapter_format, dst_chapter_format) and (
+        shutil.which("mkvmerge") is None or shutil.which("mkvextract") is None
+    ):
+        pytest.skip("legacy converter needs mkvmerge and mkvextract for xml")
+
+    legacy_dst_filepath = os.path.join(
+        str(tmp_path), "legacy" + os.path.splitext(dst_filepath)[1]
+    )
+    _run_legacy_converter(
+        monkeypatch, src_filepath, legacy_dst_filepath, dst_chapter_format
+    )
+    assert _read_chapter_list(legacy_dst_filepath) == chapter_list
+
+
+def test_malformed_ogm_chapter_raises_value_error(tmp_path):
+    src_filepath = os.path.join(str(tmp_path), "src.txt")
+    with open(src_filepath, "w", encoding="utf-8-sig") as file:
+        file.write("CHAPTER01=00:00:00.000\nCHAPTER01 Opening\n")
+
+    with pytest.raises(ValueError):
+        chapter._parse_text_chapter(src_filepath)
+
+
+def test_ogm_chapter_without_name_line_raises_value_error(tmp_path):
+    src_filepath = os.path.join(str(tmp_path), "src.txt")
+    with open(src_filepath, "w", encoding="utf-8-sig") as file:
+        file.write("CHAPTER01=00:00:00.000\n")
+
+    with pytest.raises(ValueError):
+        chapter._parse_text_chapter(src_filepath)
@@ -0,0 +1,61 @@
+import datetime
+import os
+
+import pytest
+
+pytest.importorskip("yaml")
+
+from media_master.util import config
+
+
+def test_yaml_config_with_int_keys_and_date_survives_reload(tmp_path):
+    config_filepath = os.path.join(str(tmp_path), "config.yaml")
+    with open(config_filepath, "w", encoding="utf-8") as file:
+        file.write("1: one\n2:\n  released: 2020-01-01\nname: media\n")
+
+    expected_config_dict = {
+        1: "one",
+        2: {"released": datetime.date(2020, 1, 1)},
+        "name": "media",
+    }
+    assert config.load_config(config_filepath) == expected_config_dict
+    assert config.load_config(config_filepath) == expected_config_dict
+    assert os.listdir(str(tmp_path)) == ["config.yaml"]
+
+
+def test_yaml_config_restored_with_older_mtime_is_reloaded(tmp_path):
+    config_filepath = os.path.join(str(tmp_path), "config.yaml")
+    with open(config_filepath, "w", encoding="utf-8") as file:
+        file.write("name: media\n")
+    assert config.load_config(config_filepath) == {"name": "media"}
+
+    config_stat = os.stat(config_filepath)
+    with open(config_filepath, "w", encoding="utf-8") as file:
+        file.write("name: restored media\n")
+    os.utime(
+        config_filepath,
+        ns=(config_stat.st_atime_ns, config_stat.st_mtime_ns - 10 ** 9),
+    )
+
+    assert config.load_config(config_filepath) == {"name": "restored media"}
+
+
+def test_save_config_round_trip(tmp_path):
+    config_json_filepath = os.path.join(str(tmp_path), "saved", "config.json")
+    config_dict = {"name": "メディア", "list": [1, 2], "nested": {"flag": False}}
+
+    config.save_config(config_json_filepath, config_dict)
+
+    assert not os.path.isfile(config_json_filepath + ".tmp")
+    assert config.load_config(config_json_filepath) == config_dict
+
+
+def test_save_config_uses_two_space_indent(tmp_path):
+    config_json_filepath = os.path.join(str(tmp_path), "config.json")
+
+    config.save_config(config_json_filepath, {"nested": {"flag": True}})
+
+    with open(config_json_filepath, encoding="utf-8") as file:
+        line_list: list = file.read().splitlines()
+    assert line_list[1] == '  "nested": {'
+    assert line_list[2] == '    "flag": true'
@@ -0,0 +1,34 @@
+import copy
+import pickle
+
+import pytest
+
+from media_master.util.constant import global_constant
+
+
+def test_global_constant_is_shared_and_immutable():
+    constant = global_constant()
+    assert global_constant() is constant
+
+    with pytest.raises(TypeError):
+        constant.mediainfo_encoder_colorprim_dict["BT.709"] = "unknown"
+    with pytest.raises(AttributeError):
+        constant.available_package_format_set.add("avi")
+    with pytest.raises(AttributeError):
+        constant.all_iso639_code_set.clear()
+    with pytest.raises(AttributeError):
+        constant.available_config_format_extension_dict["yaml"].add(".txt")
+
+    assert "mkv" in constant.available_package_format_set
+    assert constant.config_extension_format_dict[".yml"] == "yaml"
+
+
+def test_global_constant_can_be_deep_copied_and_pickled():
+    constant = global_constant()
+
+    assert copy.deepcopy(constant) == constant
+    assert pickle.loads(pickle.dumps(constant)) == constant
+
+    restored_constant = pickle.loads(pickle.dumps(constant))
+    with pytest.raises(TypeError):
+        restored_constant.config_extension_format_dict[".txt"] = "text"